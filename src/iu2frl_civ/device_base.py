@@ -3,21 +3,75 @@ Custom class to communicate with ICOM devices using CI-V protocol
 """
 
 from abc import ABC
+import os
 import sys
+import array
+import functools
 import logging
 from typing import Tuple
 import serial
 
 from .enums import OperatingMode, SelectedFilter, TuningStep, VFOOperation, ScanMode
 from .fakeserial import FakeSerial
+from .utils import RangeConverter, _BCD_ENCODE, _parse_hex_address
 
 
 logger = logging.getLogger("iu2frl-civ")
 
+# Linux serial ioctls used to toggle the low latency flag (see linux/serial.h)
+TIOCGSERIAL = 0x541E
+TIOCSSERIAL = 0x541F
+ASYNC_LOW_LATENCY = 0x2000
+
+
+# Wakeup preambles to send before the power on command, indexed by baudrate
+_WAKEUP_PREAMBLES = {115200: 150, 57600: 75, 38400: 50, 19200: 25, 9600: 13}
+_WAKEUP_PREAMBLES_DEFAULT = 7  # Used with any other baudrate
+
+# On/off data of the boolean settings, indexed by the setting value
+_FLAG_DATA = (b"\x00", b"\x01")
+_SCOPE_FLAG_DATA = (b"\x00\x00", b"\x00\x01")  # Main scope + on/off
+
+# Single BCD byte data of the settings, indexed by value (0 to 99)
+_BCD_BYTES = tuple(_BCD_ENCODE[i : i + 1] for i in range(100))
+
+# Memory channel data (two BCD bytes), indexed by channel number (0001=M-CH01, 0099=M-CH99, 0100=P1, 0101=P2)
+_MEMORY_CHANNEL_BYTES = tuple(_BCD_BYTES[i // 100] + _BCD_BYTES[i % 100] for i in range(102))
+
+# Conversions between the raw levels (0 to 255) and percentages
+_RAW_TO_PERCENT = RangeConverter(0, 255, 0, 100)
+_PERCENT_TO_RAW = RangeConverter(0, 100, 0, 255)
+
+# Scope span data (fixed 0x00 + span frequency in BCD), indexed by the span in ±Hz
+_SCOPE_SPAN_BYTES = {
+    2500: b"\x00\x00\x25\x00\x00\x00",
+    5000: b"\x00\x00\x50\x00\x00\x00",
+    10000: b"\x00\x00\x00\x01\x00\x00",
+    25000: b"\x00\x00\x50\x02\x00\x00",
+    50000: b"\x00\x00\x00\x05\x00\x00",
+    100000: b"\x00\x00\x00\x10\x00\x00",
+    250000: b"\x00\x00\x00\x25\x00\x00",
+    500000: b"\x00\x00\x00\x50\x00\x00",
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _mode_name(value: int) -> str:
+    """Name of the operating mode from its BCD encoded byte"""
+    return OperatingMode((value >> 4) * 10 + (value & 0x0F)).name
+
+
+@functools.lru_cache(maxsize=16)
+def _filter_name(value: int) -> str:
+    """Name of the selected filter from its BCD encoded byte"""
+    return SelectedFilter((value >> 4) * 10 + (value & 0x0F)).name
+
 
 class DeviceBase(ABC):
     """Create a CI-V object to interact with the radio transceiver"""
 
+    __slots__ = ("_ser", "_read_attempts", "transceiver_address", "controller_address", "fake", "debug")
+
     _ser: serial.Serial  # Serial port object
     _read_attempts: int  # How many attempts before giving up the read process
     transceiver_address: bytes  # Hexadecimal address of the radio transceiver
@@ -28,19 +82,14 @@ class DeviceBase(ABC):
     def __init__(self, radio_address: str, port="/dev/ttyUSB0", baudrate: int = 19200, debug=False, controller_address="0xE0", timeout=1, attempts=3, fake=False):
 
         self._read_attempts = attempts
-        # Validate the transceiver address
-        if isinstance(radio_address, str) and str(radio_address).startswith("0x"):
-            self.transceiver_address = bytes.fromhex(radio_address[2:])
-        else:
-            raise ValueError("Transceiver address must be in hexadecimal format (0x00)")
-        # Validate the controller address
-        if isinstance(controller_address, str) and str(controller_address).startswith("0x"):
-            self.controller_address = bytes.fromhex(controller_address[2:])
-        else:
-            raise ValueError("Controller address must be in hexadecimal format (0x00)")
+        # Validate the addresses
+        self.transceiver_address = _parse_hex_address(radio_address, "Transceiver")
+        self.controller_address = _parse_hex_address(controller_address, "Controller")
         # Open the serial port
         if not fake:
             self._ser = serial.Serial(port, baudrate, timeout=timeout, dsrdtr=False)
+            if sys.platform == "linux":
+                self._enable_low_latency()
         else:
             self._ser = FakeSerial(self.transceiver_address, self.controller_address, baudrate, port)
         # Configure logging if needed
@@ -54,6 +103,51 @@ class DeviceBase(ABC):
         logger.debug("Opened port: %s", self._ser.name)
         logger.debug("Baudrate: %s bps", self._ser.baudrate)
 
+    def _enable_low_latency(self):
+        """
+        Enable the low latency mode of the serial port (like `setserial /dev/ttyUSB0 low_latency`)
+
+        USB-serial adapters (FTDI, CH340) buffer replies for up to 16ms by default,
+        which dominates the duration of each CI-V transaction.
+        This is only supported on Linux, errors are logged and ignored.
+        """
+        try:
+            import fcntl
+
+            # serial_struct is smaller than 128 bytes, flags are the 5th integer
+            serial_struct = array.array("i", [0] * 32)
+            fcntl.ioctl(self._ser.fd, TIOCGSERIAL, serial_struct, True)
+            serial_struct[4] |= ASYNC_LOW_LATENCY
+            fcntl.ioctl(self._ser.fd, TIOCSSERIAL, serial_struct)
+            logger.debug("Enabled low latency mode on %s", self._ser.name)
+            return
+        except (ImportError, AttributeError, OSError) as e:
+            logger.debug("Cannot enable low latency mode using ioctl: %s", e)
+        # Fallback to the FTDI latency timer exposed by sysfs
+        try:
+            tty_name = os.path.basename(os.path.realpath(self._ser.port))
+            with open(f"/sys/bus/usb-serial/devices/{tty_name}/latency_timer", "w", encoding="ascii") as latency_timer:
+                latency_timer.write("1")
+            logger.debug("Latency timer of %s set to 1ms", tty_name)
+        except (TypeError, OSError) as e:
+            logger.debug("Cannot set the latency timer: %s", e)
+
+    def _send_setting(self, command: bytes, value: int) -> bool:
+        """
+        Send a command whose data is a single BCD byte (0 to 99) using the `utils` of the device
+
+        Returns: True if the command was successful, False otherwise
+        """
+        return len(self.utils.send_command(command, data=_BCD_BYTES[value])) > 0
+
+    def _send_flag(self, command: bytes, on: bool, flag_data: tuple = _FLAG_DATA) -> bytes:
+        """
+        Send a command which turns a setting on or off using the `utils` of the device
+
+        Returns: the response from the transceiver
+        """
+        return self.utils.send_command(command, data=flag_data[1 if on else 0])
+
     def set_tuning_step(self, ts: TuningStep) -> bytes:
         """
         Set the tuning step on the radio transceiver
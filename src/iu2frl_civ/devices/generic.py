@@ -7,7 +7,7 @@ from typing import Tuple
 import logging
 
 from ..enums import OperatingMode, SelectedFilter, VFOOperation, ScanMode, DeviceType
-from ..device_base import DeviceBase
+from ..device_base import DeviceBase, _WAKEUP_PREAMBLES, _WAKEUP_PREAMBLES_DEFAULT, _SCOPE_FLAG_DATA, _SCOPE_SPAN_BYTES, _RAW_TO_PERCENT, _PERCENT_TO_RAW, _MEMORY_CHANNEL_BYTES, _mode_name, _filter_name
 from ..utils import Utils
 
 logger = logging.getLogger("iu2frl-civ")
@@ -16,6 +16,14 @@ logger = logging.getLogger("iu2frl-civ")
 class GenericDevice(DeviceBase):
     """Create a CI-V object to interact with a generic the radio transceiver"""
 
+    # Meter calibration points from the manual (raw value, measured value)
+    _PO_POINTS = ((0, 0), (143, 50), (213, 100))  # raw -> PO%
+    _SWR_POINTS = ((0, 1), (48, 1.5), (80, 2.0), (120, 3.0), (255, 99))  # raw -> SWR
+    _ALC_POINTS = ((0, 0), (120, 100))  # raw -> ALC%
+    _COMP_POINTS = ((0, 0), (130, 15), (241, 30))  # raw -> dB
+    _VD_POINTS = ((0, 0), (13, 10), (241, 16))  # raw -> V
+    _ID_POINTS = ((0, 0), (97, 10), (146, 15), (241, 25))  # raw -> A
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -27,18 +35,7 @@ class GenericDevice(DeviceBase):
 
         Returns: the response from the transceiver
         """
-        if self._ser.baudrate == 115200:
-            wakeup_preamble_count = 150
-        elif self._ser.baudrate == 57600:
-            wakeup_preamble_count = 75
-        elif self._ser.baudrate == 38400:
-            wakeup_preamble_count = 50
-        elif self._ser.baudrate == 19200:
-            wakeup_preamble_count = 25
-        elif self._ser.baudrate == 9600:
-            wakeup_preamble_count = 13
-        else:
-            wakeup_preamble_count = 7
+        wakeup_preamble_count = _WAKEUP_PREAMBLES.get(self._ser.baudrate, _WAKEUP_PREAMBLES_DEFAULT)
         logger.debug("Sending power-on command with %i wakeup preambles", wakeup_preamble_count)
         return self.utils.send_command(b"\x18\x01", preamble=b"\xfe" * wakeup_preamble_count)
 
@@ -70,7 +67,7 @@ class GenericDevice(DeviceBase):
         try:
             reply = self.utils.send_command(b"\x03")
             return self.utils.decode_frequency(reply[5:10])
-        except:
+        except Exception:
             return -1
 
     def read_operating_mode(self) -> Tuple[str, str]:
@@ -83,9 +80,7 @@ class GenericDevice(DeviceBase):
         """
         reply = self.utils.send_command(b"\x04")
         if len(reply) == 8:
-            mode = OperatingMode(int(reply[5:6].hex())).name
-            fil = SelectedFilter(int(reply[6:7].hex())).name
-            return [mode, fil]
+            return [_mode_name(reply[5]), _filter_name(reply[6])]
         else:
             return ["ERR", "ERR"]
 
@@ -124,7 +119,7 @@ class GenericDevice(DeviceBase):
         reply = self.utils.send_command(b"\x14\x01")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            return self.utils.convert_to_range(raw_value, 0, 255, 0, 100)
+            return _RAW_TO_PERCENT(raw_value)
         return -1
 
     def read_rf_gain(self) -> int:
@@ -140,7 +135,7 @@ class GenericDevice(DeviceBase):
         reply = self.utils.send_command(b"\x14\x02")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            return self.utils.convert_to_range(raw_value, 0, 255, 0, 100)
+            return _RAW_TO_PERCENT(raw_value)
         return -1
 
     def read_squelch_level(self) -> int:
@@ -156,7 +151,7 @@ class GenericDevice(DeviceBase):
         reply = self.utils.send_command(b"\x14\x03")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            return self.utils.convert_to_range(raw_value, 0, 255, 0, 100)
+            return _RAW_TO_PERCENT(raw_value)
         return -1
 
     def read_nr_level(self) -> int:
@@ -172,7 +167,7 @@ class GenericDevice(DeviceBase):
         reply = self.utils.send_command(b"\x14\x06")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            return self.utils.convert_to_range(raw_value, 0, 255, 0, 100)
+            return _RAW_TO_PERCENT(raw_value)
         return -1
 
     def read_nb_level(self) -> float:
@@ -188,7 +183,7 @@ class GenericDevice(DeviceBase):
         reply = self.utils.send_command(b"\x14\x12")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            return self.utils.convert_to_range(raw_value, 0, 255, 0, 100)
+            return _RAW_TO_PERCENT(raw_value)
         return -1
 
     def read_smeter(self) -> int:
@@ -241,9 +236,7 @@ class GenericDevice(DeviceBase):
         reply = self.utils.send_command(b"\x15\x11")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            # Known points (raw -> PO%)
-            points = [(0, 0), (143, 50), (213, 100)]
-            return self.utils.linear_interpolate(raw_value, points)
+            return self.utils.linear_interpolate(raw_value, self._PO_POINTS)
         return -1
 
     def read_swr_meter(self) -> float:
@@ -257,9 +250,7 @@ class GenericDevice(DeviceBase):
         reply = self.utils.send_command(b"\x15\x12")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            # Known points (raw -> SWR)
-            points = [(0, 1), (48, 1.5), (80, 2.0), (120, 3.0), (255, 99)]
-            return self.utils.linear_interpolate(raw_value, points)
+            return self.utils.linear_interpolate(raw_value, self._SWR_POINTS)
         return -1
 
     def read_alc_meter(self) -> float:
@@ -271,9 +262,7 @@ class GenericDevice(DeviceBase):
         reply = self.utils.send_command(b"\x15\x13")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            # Known points (raw -> ALC%)
-            points = [(0, 0), (120, 100)]
-            return self.utils.linear_interpolate(raw_value, points)
+            return self.utils.linear_interpolate(raw_value, self._ALC_POINTS)
         return -1
 
     def read_comp_meter(self) -> float:
@@ -286,9 +275,7 @@ class GenericDevice(DeviceBase):
         reply = self.utils.send_command(b"\x15\x14")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            # Known points (raw -> dB)
-            points = [(0, 0), (130, 15), (241, 30)]
-            return self.utils.linear_interpolate(raw_value, points)
+            return self.utils.linear_interpolate(raw_value, self._COMP_POINTS)
         return -1
 
     def read_vd_meter(self) -> float:
@@ -306,9 +293,7 @@ class GenericDevice(DeviceBase):
         reply = self.utils.send_command(b"\x15\x15")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            # Known points (raw -> A)
-            points = [(0, 0), (13, 10), (241, 16)]
-            return self.utils.linear_interpolate(raw_value, points)
+            return self.utils.linear_interpolate(raw_value, self._VD_POINTS)
         return -1.0  # Return -1 in case of error
 
     def read_id_meter(self) -> float:
@@ -326,17 +311,12 @@ class GenericDevice(DeviceBase):
         reply = self.utils.send_command(b"\x15\x16")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            # List of known points (from the manual - byte -> Ampere)
-            points = [(0, 0), (97, 10), (146, 15), (241, 25)]
-            return self.utils.linear_interpolate(raw_value, points)
+            return self.utils.linear_interpolate(raw_value, self._ID_POINTS)
         return -1.0  # Return -1 in case of error
 
     def set_antenna_tuner(self, on: bool):
         """Turns the antenna tuner on or off."""
-        if on:
-            self.utils.send_command(b"\x1C\x01", b"\x01")  # Turn tuner ON
-        else:
-            self.utils.send_command(b"\x1C\x01", b"\x00")  # Turn tuner OFF
+        self._send_flag(b"\x1C\x01", on)
 
     def tune_antenna_tuner(self):
         """Starts the antenna tuner tuning process."""
@@ -348,10 +328,10 @@ class GenericDevice(DeviceBase):
 
     def send_cw_message(self, message: str):
         """Send a CW message. Limited to 30 characters"""
-        if len(message) > 30:
-            raise ValueError("Message must be 30 characters or less")
         # convert the string to bytes
         message_bytes = message.encode("ascii")
+        if len(message_bytes) > 30:
+            raise ValueError("Message must be 30 characters or less")
         self.utils.send_command(b"\x17", data=message_bytes)
 
     def set_ip_plus_function(self, enable: bool) -> bool:
@@ -364,8 +344,7 @@ class GenericDevice(DeviceBase):
         Returns:
             bool: True if the command was successful, False otherwise.
         """
-        value = 1 if enable else 0
-        reply = self.utils.send_command(b"\x1a\x07", data=bytes([value]))
+        reply = self._send_flag(b"\x1a\x07", enable)
         return len(reply) > 0
 
     def set_mf_band_attenuator(self, enable: bool) -> bool:
@@ -378,13 +357,13 @@ class GenericDevice(DeviceBase):
         Returns:
             bool: True if the command was successful, False otherwise.
         """
-        reply = self.utils.send_command(b"\x1a\x05\x01\x93", data=bytes([int(enable)]))
+        reply = self._send_flag(b"\x1a\x05\x01\x93", enable)
         return len(reply) > 0
 
     def set_vfo_mode(self, vfo_mode: VFOOperation = VFOOperation.SELECT_VFO_A):
         """Sets the VFO mode."""
         if vfo_mode in VFOOperation:
-            self.utils.send_command(b"\x07", data=vfo_mode.value)
+            self.utils.send_command(b"\x07", data=vfo_mode)
         else:
             raise ValueError("Invalid vfo_mode")
 
@@ -395,23 +374,11 @@ class GenericDevice(DeviceBase):
         # 0001 to 0109 Select the Memory channel *(0001=M-CH01, 0099=M-CH99)
         # 0100 Select program scan edge channel P1
         # 0101 Select program scan edge channel P2
-
-        if 0 < memory_channel < 100:
-            hex_list = ["0x00"]
-        elif memory_channel in [100, 101]:
-            hex_list = ["0x01"]
-        else:
-            raise ValueError("Memory channel must be between 1 and 101")
-        number_as_string = str(memory_channel).rjust(3, "0")
-        hex_list.append(f"0x{number_as_string[1]}{number_as_string[2]}")
-        self.utils.send_command(b"\x08", data=bytes([int(hx, 16) for hx in hex_list]))
+        self.utils.send_command(b"\x08", data=_MEMORY_CHANNEL_BYTES[memory_channel])
 
     def set_mox(self, transmit: bool):
         """Turns the MOX on or off"""
-        if transmit:
-            self.utils.send_command(b"\x1C\x00", b"\x01")
-        else:
-            self.utils.send_command(b"\x1C\x00", b"\x00")
+        self._send_flag(b"\x1C\x00", transmit)
 
     def set_lcd_brightness(self, level: int):
         """Sets the LCD brightness, from 0 to 255"""
@@ -422,36 +389,24 @@ class GenericDevice(DeviceBase):
 
     def set_display_font(self, round: bool = True):
         """Set the display font"""
-        if round:
-            self.utils.send_command(b"\x1A\x05\x00\x83", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x00\x83", b"\x00")
+        self._send_flag(b"\x1A\x05\x00\x83", round)
 
     def set_scope_mode_fixed(self, fixed_mode: bool = False):
         """Sets the scope mode, True for Fixed, False for Center"""
-        if fixed_mode:
-            self.utils.send_command(b"\x27\x14", b"\x00\x01")
-        else:
-            self.utils.send_command(b"\x27\x14", b"\x00\x00")
+        self._send_flag(b"\x27\x14", fixed_mode, _SCOPE_FLAG_DATA)
 
     def set_scope_enabled(self, enabled: bool) -> bool:
         """
         Set the Scope ON/OFF status
         """
-        if enabled:
-            self.utils.send_command(b"\x27\x10", b"\x01")
-        else:
-            self.utils.send_command(b"\x27\x10", b"\x00")
+        self._send_flag(b"\x27\x10", enabled)
         return True
 
     def set_scope_data_out(self, enabled: bool) -> bool:
         """
         Enables scope data output to the COM port
         """
-        if enabled:
-            self.utils.send_command(b"\x27\x11", b"\x01")
-        else:
-            self.utils.send_command(b"\x27\x11", b"\x00")
+        self._send_flag(b"\x27\x11", enabled)
         return True
 
     def set_scope_span(self, span_hz: int):
@@ -460,11 +415,9 @@ class GenericDevice(DeviceBase):
         Valid values are: 2500, 5000, 10000, 25000, 50000, 100000, 250000, 500000
         Example: 50000 => ±50000Hz => 100000Hz
         """
-        valid_values = [2500, 5000, 10000, 25000, 50000, 100000, 250000, 500000]
-        if span_hz not in valid_values:
+        span_bytes = _SCOPE_SPAN_BYTES.get(span_hz)
+        if span_bytes is None:
             raise ValueError(f"Invalid value: {span_hz}")
-        span_bytes = b"\x00"
-        span_bytes += self.utils.encode_frequency(span_hz)
         self.utils.send_command(b"\x27\x15", data=span_bytes)
 
     def set_scope_sweep_speed(self, speed: int):
@@ -482,10 +435,7 @@ class GenericDevice(DeviceBase):
 
     def set_display_image_type(self, blue_background: bool = True):
         """Set display image type"""
-        if blue_background:
-            self.utils.send_command(b"\x1A\x05\x00\x82", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x00\x82", b"\x00")
+        self._send_flag(b"\x1A\x05\x00\x82", blue_background)
 
     def clear_current_memory(self):
         """Clears the current memory"""
@@ -506,8 +456,7 @@ class GenericDevice(DeviceBase):
         """
         if not (1 <= depth <= 10):
             raise ValueError("Depth must be between 1 and 10")
-        reply = self.utils.send_command(b"\x1a\x05\x01\x89", data=bytes([depth - 1]))
-        return len(reply) > 0
+        return self._send_setting(b"\x1a\x05\x01\x89", depth - 1)
 
     def set_nb_width(self, width: int) -> bool:
         """
@@ -524,7 +473,7 @@ class GenericDevice(DeviceBase):
         """
         if not (0 <= width <= 100):
             raise ValueError("Width must be between 0 and 100")
-        width = int(self.utils.convert_to_range(width, 0, 100, 0, 255))
+        width = int(_PERCENT_TO_RAW(width))
         width_bytes = self.utils.encode_int_to_icom_bytes(width)
         reply = self.utils.send_command(b"\x1a\x05\x01\x90", data=width_bytes)
         return len(reply) > 0
@@ -567,8 +516,7 @@ class GenericDevice(DeviceBase):
         """
         if not (0 <= delay <= 20):
             raise ValueError("Delay must be between 0 and 20")
-        reply = self.utils.send_command(b"\x1a\x05\x01\x91", data=bytes([delay]))
-        return len(reply) > 0
+        return self._send_setting(b"\x1a\x05\x01\x91", delay)
 
     def set_vox_voice_delay(self, voice_delay: int) -> bool:
         """
@@ -589,8 +537,7 @@ class GenericDevice(DeviceBase):
         """
         if not (0 <= voice_delay <= 3):
             raise ValueError("Value must be between 0 and 3")
-        reply = self.utils.send_command(b"\x1a\x05\x01\x92", data=bytes([voice_delay]))
-        return len(reply) > 0
+        return self._send_setting(b"\x1a\x05\x01\x92", voice_delay)
 
     def start_scan(self, scan_type: ScanMode = ScanMode.SELECT_DF_SPAN_100KHZ):
         """
@@ -601,47 +548,34 @@ class GenericDevice(DeviceBase):
             an exception is returned
         """
         if scan_type in ScanMode:
-            self.utils.send_command(b"\x0E", data=scan_type.value)
+            self.utils.send_command(b"\x0E", data=scan_type)
         else:
             raise ValueError("Invalid scan type")
 
     def set_scan_speed(self, high: bool):
         """Sets the scan speed"""
-        if high:
-            self.utils.send_command(b"\x1A\x05\x01\x78", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x01\x78", b"\x00")
+        self._send_flag(b"\x1A\x05\x01\x78", high)
 
     def set_scope_reference_level(self, level: float):
         """Sets the scope reference level, range is -20.0 to +20.0 dB in 0.5 dB steps"""
         if not (-20.0 <= level <= 20.0):
             raise ValueError("Level must be between -20.0 and +20.0 dB")
-        if level % 0.5 != 0:
+        half_steps = round(level * 2)
+        if half_steps != level * 2:
             raise ValueError("Level must be in 0.5 dB increments")
 
-        # Convert the level to the required format
-        level_bytes = b"\x00"
-        level_bytes += self.utils.encode_int_to_icom_bytes(abs(level * 100))
-        if level >= 0:
-            level_bytes += b"\x00"
-        else:
-            level_bytes += b"\x01"
+        # Main scope, absolute level in 0.01 dB (BCD) and sign
+        level_bytes = b"\x00" + self.utils.encode_int_to_icom_bytes(abs(half_steps) * 50) + (b"\x01" if half_steps < 0 else b"\x00")
 
         self.utils.send_command(b"\x27\x19", data=level_bytes)
 
     def set_scope_vbw(self, wide: bool = True):
         """Sets the scope VBW (Video Band Width), True for wide, false for narrow"""
-        if wide:
-            self.utils.send_command(b"\x27\x1D", b"\x00\x01")
-        else:
-            self.utils.send_command(b"\x27\x1D", b"\x00\x00")
+        self._send_flag(b"\x27\x1D", wide, _SCOPE_FLAG_DATA)
 
     def set_scope_waterfall_display(self, on: bool):
         """Turns the waterfall display on or off for the scope"""
-        if on:
-            self.utils.send_command(b"\x1A\x05\x01\x07", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x01\x07", b"\x00")
+        self._send_flag(b"\x1A\x05\x01\x07", on)
 
 
 # Required attributes for plugin discovery
@@ -1,13 +1,84 @@
 """IC-706 MK-II transceiver CI-V commands and responses"""
 
-from ..device_base import DeviceBase
-from ..utils import Utils
-from ..enums import OperatingMode, VFOOperation, TuningStep, DeviceType
+import logging
+import threading
+import collections
+
+import serial
+
+from ..device_base import DeviceBase, _MEMORY_CHANNEL_BYTES
+from ..utils import Utils, AsyncUtils, _check_command, _dec_bcd_le
+from ..exceptions import CivProtocolException, CivTimeoutException
+from ..enums import OperatingMode, SelectedFilter, VFOOperation, TuningStep, DeviceType
+
+logger = logging.getLogger("iu2frl-civ")
+
+# CI-V commands
+_CMD_READ_FREQ = b"\x03"
+_CMD_READ_MODE = b"\x04"
+_CMD_SEND_FREQ = b"\x05"
+_CMD_SET_MODE = b"\x06"
+_CMD_SET_VFO = b"\x07"
+_CMD_SET_MEM = b"\x08"
+_CMD_MEM_TO_VFO = b"\x0A"
+_CMD_MEM_CLEAR = b"\x0B"
+_CMD_STOP_SCAN = b"\x0E\x00"
+_CMD_START_SCAN = b"\x0E\x01"
+_CMD_SPLIT = b"\x0F"
+_CMD_TUNING_STEP = b"\x10"
+
+_FREQ_MIN = 30_000  # Lowest receivable frequency in Hz
+_FREQ_MAX = 199_999_999  # Highest receivable frequency in Hz (2m band included)
+
+
+# Checks and parsing shared by IC706MKII and AsyncIC706MKII
+def _check_frequency(frequency_hz: int | float) -> int:
+    """Convert the frequency to an integer (for scientific notation ex: 14.074e6) and check it is in range"""
+    frequency_hz = int(frequency_hz)
+    if not (_FREQ_MIN <= frequency_hz <= _FREQ_MAX):
+        raise ValueError(f"Frequency must be between {_FREQ_MIN} Hz and {_FREQ_MAX} Hz")
+    return frequency_hz
+
+
+def _check_vfo_mode(vfo_mode: VFOOperation):
+    """Raise a ValueError if the VFO mode is not valid"""
+    if not isinstance(vfo_mode, VFOOperation):
+        raise ValueError("Invalid vfo_mode")
+
+
+def _check_memory_channel(memory_channel: int):
+    """Raise a ValueError if the memory channel is not valid"""
+    if not (1 <= memory_channel <= 101):
+        raise ValueError("Memory channel must be between 1 and 101")
+
+
+def _mode_data(mode: OperatingMode, new_filter: SelectedFilter = None) -> bytes:
+    """Data of command 0x06: mode and optional filter"""
+    if new_filter is None:
+        return bytes((mode.value,))
+    return bytes((mode.value, new_filter.value))
+
+
+def _parse_frequency(reply: bytes) -> int:
+    """Frequency in Hz of a reply to command 0x03, -1 if the reply is too short"""
+    if len(reply) < 11:
+        return -1
+    return _dec_bcd_le(reply, 5, 5)
+
+
+def _parse_mode(reply: bytes) -> OperatingMode:
+    """Mode of a reply to command 0x04"""
+    if len(reply) < 7:
+        raise CivProtocolException(f"Invalid operating mode reply (length: {len(reply)})")
+    # Mode is BCD encoded
+    return OperatingMode((reply[5] >> 4) * 10 + (reply[5] & 0x0F))
 
 
 class IC706MKII(DeviceBase):
     """Create a CI-V object to interact with an IC-706 MK-II transceiver"""
 
+    __slots__ = ("utils", "_tx_queue", "_tx_lock", "_flush_delay_s", "_flush_timer", "_last_freq_hz", "_last_mode", "skip_redundant_writes")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -17,67 +88,185 @@ class IC706MKII(DeviceBase):
 
         self.utils = Utils(self._ser, self.transceiver_address, self.controller_address, self._read_attempts)
 
+        # Commands waiting to be coalesced into a single write
+        self._tx_queue = collections.deque()
+        self._tx_lock = threading.Lock()
+        self._flush_delay_s = 0.002
+        self._flush_timer = None
+
+        # Last values sent to or read from the transceiver, used to skip redundant writes.
+        # Disabled by default: changes made on the front panel cannot be detected,
+        # enable it only if the transceiver is controlled by this object alone.
+        self.skip_redundant_writes = False
+        self._last_freq_hz = None
+        self._last_mode = None
+
+    def _invalidate_cache(self):
+        """Forget the last frequency and mode, as the transceiver changed them"""
+        self._last_freq_hz = None
+        self._last_mode = None
+
+    def queue_command(self, command: bytes, data: bytes = b""):
+        """
+        Queue a command which does not need a reply, to be sent together with the following ones
+
+        Commands queued within 2ms are coalesced into a single serial write,
+        the order of the queued commands is preserved.
+        Commands sent directly (like read_*) do not wait for the queue: call
+        `flush_commands` first if they must be sent after the queued ones.
+
+        Raises:
+            ValueError: if the command is not valid (checked now, as it will be sent by another thread)
+        """
+        _check_command(command)
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise ValueError("Data must be a byte string")
+        data = bytes(data)
+        with self._tx_lock:
+            self._invalidate_cache()
+            self._tx_queue.append((command, data))
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._flush_delay_s, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush_commands(self) -> list:
+        """
+        Send all the queued commands at once
+
+        Returns: the list of responses from the transceiver
+        """
+        # Only take the queued commands under the lock, so queue_command is not blocked by the serial I/O
+        with self._tx_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            commands = list(self._tx_queue)
+            self._tx_queue.clear()
+        if not commands:
+            return []
+        return self.utils.send_commands(commands)
+
+    def _flush(self):
+        """Send the queued commands from the flusher thread, where errors can only be logged"""
+        try:
+            self.flush_commands()
+        except Exception:  # Errors would be lost in the flusher thread otherwise
+            logger.exception("Failed to send queued commands")
+
     def read_operating_frequency(self) -> int:
         """
         Read the operating frequency
 
-        Returns: the currently tuned frequency in Hz
+        The command is retried once in case of timeout or serial errors,
+        after discarding any partially received frame.
+
+        Returns: the currently tuned frequency in Hz, -1 if the reply is too short
+
+        Raises:
+            CivTimeoutException: if the transceiver did not reply
         """
         try:
-            reply = self.utils.send_command(b"\x03")
-            return self.utils.decode_frequency(reply[5:10])
-        except:
-            return -1
+            reply = self.utils.send_command(_CMD_READ_FREQ)
+        except (CivTimeoutException, serial.SerialException) as e:
+            logger.debug("Retrying frequency read after error: %s", e)
+            self.utils.reset_input_buffer()
+            reply = self.utils.send_command(_CMD_READ_FREQ)
+        frequency_hz = _parse_frequency(reply)
+        if frequency_hz >= 0:
+            self._last_freq_hz = frequency_hz
+        return frequency_hz
 
     def read_operating_mode(self) -> OperatingMode:
         """
         Read the operating mode
 
         Returns: the current mode
+
+        Raises:
+            CivProtocolException: if the reply does not contain the mode
         """
-        reply = self.utils.send_command(b"\x04")
-        if len(reply) == 8:
-            mode = OperatingMode(int(reply[5:6].hex()))
-            return mode
+        reply = self.utils.send_command(_CMD_READ_MODE)
+        mode = _parse_mode(reply)
+        # Mode (and filter, if present) as they would be sent by set_operating_mode
+        self._last_mode = bytes(reply[5:-1])
+        return mode
 
-    def set_operating_mode(self, mode: OperatingMode):
-        """Sets the operating mode and filter."""
-        # Command 0x06 with mode and filter data
-        data = mode.value.to_bytes()
-        self.utils.send_command(b"\x06", data=data)
+    def set_operating_mode(self, mode: OperatingMode, new_filter: SelectedFilter = None):
+        """
+        Sets the operating mode and filter (if specified).
+
+        If `skip_redundant_writes` is enabled, nothing is sent when the same mode was the last one being set or read.
+        """
+        data = _mode_data(mode, new_filter)
+        if self.skip_redundant_writes and data == self._last_mode:
+            return
+        self.utils.send_command(_CMD_SET_MODE, data=data)
+        self._last_mode = data
 
     def send_operating_frequency(self, frequency_hz: int | float) -> bool:
         """
         Send the operating frequency
 
+        If `skip_redundant_writes` is enabled, nothing is sent when the frequency is the last one being sent or read.
+
         Returns: True if the frequency was properly sent
         """
-        if isinstance(frequency_hz, float):  # fix for using scientific notation ex: 14.074e6
-            frequency_hz = int(frequency_hz)
-
-        # Validate input
-        if not (10_000 <= frequency_hz <= 200_000_000):  # IC-706 MK-II frequency range in Hz
-            raise ValueError("Frequency must be between 10 kHz and 200 MHz")
+        frequency_hz = _check_frequency(frequency_hz)
+        if self.skip_redundant_writes and frequency_hz == self._last_freq_hz:
+            return True
         # Encode the frequency
         data = self.utils.encode_frequency(frequency_hz)
 
         # Use the provided _send_command method to send the command
-        reply = self.utils.send_command(b"\x05", data=data)
-        if len(reply) > 0:
-            return True
-        else:
+        reply = self.utils.send_command(_CMD_SEND_FREQ, data=data)
+        if len(reply) == 0:
             return False
+        self._last_freq_hz = frequency_hz
+        return True
 
     def set_vfo_mode(self, vfo_mode: VFOOperation = VFOOperation.SELECT_VFO_A):
         """Sets the VFO mode."""
-        if vfo_mode in VFOOperation:
-            self.utils.send_command(b"\x07", data=vfo_mode.value)
-        else:
-            raise ValueError("Invalid vfo_mode")
+        _check_vfo_mode(vfo_mode)
+        self._invalidate_cache()
+        self.utils.send_command(_CMD_SET_VFO, data=vfo_mode)
+
+    def configure(self, vfo_mode: VFOOperation = None, mode: OperatingMode = None, frequency_hz: int | float = None) -> bool:
+        """
+        Set VFO, operating mode and frequency using a single serial transaction
+
+        Parameters which are not specified are left untouched.
+
+        Returns: True if all the commands were properly sent
+        """
+        commands = []
+        if vfo_mode is not None:
+            _check_vfo_mode(vfo_mode)
+            commands.append((_CMD_SET_VFO, vfo_mode))
+        if mode is not None:
+            mode_data = _mode_data(mode)
+            commands.append((_CMD_SET_MODE, mode_data))
+        if frequency_hz is not None:
+            frequency_hz = _check_frequency(frequency_hz)
+            commands.append((_CMD_SEND_FREQ, self.utils.encode_frequency(frequency_hz)))
+        if not commands:
+            return True
+        if vfo_mode is not None:
+            self._invalidate_cache()
+        replies = self.utils.send_commands(commands)
+        if mode is not None:
+            self._last_mode = mode_data
+        if frequency_hz is not None:
+            self._last_freq_hz = frequency_hz
+        return len(replies) == len(commands)
 
     def stop_scan(self):
         """Stops the scan."""
-        self.utils.send_command(b"\x0E\x00")
+        try:
+            self.utils.send_command(_CMD_STOP_SCAN)
+        finally:
+            # The scan stopped on a frequency which is not known
+            self._invalidate_cache()
 
     def start_scan(self):
         """
@@ -85,43 +274,126 @@ class IC706MKII(DeviceBase):
 
         Note: this always returns some error
         """
-        self.utils.send_command(b"\x0E\x01")
+        try:
+            self.utils.send_command(_CMD_START_SCAN)
+        finally:
+            self._invalidate_cache()
 
     def set_memory_mode(self, memory_channel: int):
         """Sets the memory mode, accepts values from 1 to 101"""
-        if not (1 <= memory_channel <= 101):
-            raise ValueError("Memory channel must be between 1 and 101")
+        _check_memory_channel(memory_channel)
         # 0001 to 0109 Select the Memory channel *(0001=M-CH01, 0099=M-CH99)
         # 0100 Select program scan edge channel P1
         # 0101 Select program scan edge channel P2
-
-        if 0 < memory_channel < 100:
-            hex_list = ["0x00"]
-        elif memory_channel in [100, 101]:
-            hex_list = ["0x01"]
-        else:
-            raise ValueError("Memory channel must be between 1 and 101")
-        number_as_string = str(memory_channel).rjust(3, "0")
-        hex_list.append(f"0x{number_as_string[1]}{number_as_string[2]}")
-        self.utils.send_command(b"\x08", data=bytes([int(hx, 16) for hx in hex_list]))
+        self._invalidate_cache()
+        self.utils.send_command(_CMD_SET_MEM, data=_MEMORY_CHANNEL_BYTES[memory_channel])
 
     def memory_copy_to_vfo(self):
         """Copies memory to VFO"""
-        self.utils.send_command(b"\x0A")
+        self._invalidate_cache()
+        self.utils.send_command(_CMD_MEM_TO_VFO)
 
     def clear_current_memory(self):
         """Clears the memory"""
-        self.utils.send_command(b"\x0B")
+        self.utils.send_command(_CMD_MEM_CLEAR)
 
     def set_tuning_step(self, ts: TuningStep) -> bytes:
         if ts in TuningStep:
-            return self.utils.send_command(b"\x10", ts.value)
+            return self.utils.send_command(_CMD_TUNING_STEP, ts)
 
     def split_off(self) -> bytes:
-        return self.utils.send_command(b"\x0F", b"\x00")
+        return self.utils.send_command(_CMD_SPLIT, b"\x00")
 
     def split_on(self) -> bytes:
-        return self.utils.send_command(b"\x0F", b"\x01")
+        return self.utils.send_command(_CMD_SPLIT, b"\x01")
+
+
+class AsyncIC706MKII:
+    """
+    Create an asyncio CI-V object to interact with an IC-706 MK-II transceiver
+
+    Requires the `pyserial-asyncio` package, instances must be created with `await AsyncIC706MKII.create(...)`
+    """
+
+    def __init__(self, utils: AsyncUtils):
+        self.utils = utils
+
+    @classmethod
+    async def create(cls, radio_address: str, port="/dev/ttyUSB0", baudrate: int = 19200, debug=False, controller_address="0xE0", timeout=1, attempts=3) -> "AsyncIC706MKII":
+        """Open the serial port and return the device object"""
+        # fix for digirig
+        utils = await AsyncUtils.open(radio_address, port, baudrate, controller_address, attempts, timeout=timeout, debug=debug, rts=False, dtr=False)
+        return cls(utils)
+
+    def close(self):
+        """Close the serial port"""
+        self.utils.close()
+
+    async def read_operating_frequency(self) -> int:
+        """
+        Read the operating frequency
+
+        Returns: the currently tuned frequency in Hz, -1 if the reply is too short
+        """
+        return _parse_frequency(await self.utils.send_command_async(_CMD_READ_FREQ))
+
+    async def read_operating_mode(self) -> OperatingMode:
+        """
+        Read the operating mode
+
+        Returns: the current mode
+        """
+        return _parse_mode(await self.utils.send_command_async(_CMD_READ_MODE))
+
+    async def set_operating_mode(self, mode: OperatingMode, new_filter: SelectedFilter = None):
+        """Sets the operating mode and filter (if specified)."""
+        await self.utils.send_command_async(_CMD_SET_MODE, data=_mode_data(mode, new_filter))
+
+    async def send_operating_frequency(self, frequency_hz: int | float) -> bool:
+        """
+        Send the operating frequency
+
+        Returns: True if the frequency was properly sent
+        """
+        frequency_hz = _check_frequency(frequency_hz)
+        reply = await self.utils.send_command_async(_CMD_SEND_FREQ, data=self.utils.encode_frequency(frequency_hz))
+        return len(reply) > 0
+
+    async def set_vfo_mode(self, vfo_mode: VFOOperation = VFOOperation.SELECT_VFO_A):
+        """Sets the VFO mode."""
+        _check_vfo_mode(vfo_mode)
+        await self.utils.send_command_async(_CMD_SET_VFO, data=vfo_mode)
+
+    async def stop_scan(self):
+        """Stops the scan."""
+        await self.utils.send_command_async(_CMD_STOP_SCAN)
+
+    async def start_scan(self):
+        """Starts scanning"""
+        await self.utils.send_command_async(_CMD_START_SCAN)
+
+    async def set_memory_mode(self, memory_channel: int):
+        """Sets the memory mode, accepts values from 1 to 101"""
+        _check_memory_channel(memory_channel)
+        await self.utils.send_command_async(_CMD_SET_MEM, data=_MEMORY_CHANNEL_BYTES[memory_channel])
+
+    async def memory_copy_to_vfo(self):
+        """Copies memory to VFO"""
+        await self.utils.send_command_async(_CMD_MEM_TO_VFO)
+
+    async def clear_current_memory(self):
+        """Clears the memory"""
+        await self.utils.send_command_async(_CMD_MEM_CLEAR)
+
+    async def set_tuning_step(self, ts: TuningStep) -> bytes:
+        if ts in TuningStep:
+            return await self.utils.send_command_async(_CMD_TUNING_STEP, ts)
+
+    async def split_off(self) -> bytes:
+        return await self.utils.send_command_async(_CMD_SPLIT, b"\x00")
+
+    async def split_on(self) -> bytes:
+        return await self.utils.send_command_async(_CMD_SPLIT, b"\x01")
 
 
 # Required attributes for plugin discovery
@@ -9,11 +9,70 @@ import datetime
 import time
 
 from ..enums import OperatingMode, SelectedFilter, VFOOperation, ScanMode, DeviceType, ToneType
-from ..device_base import DeviceBase
-from ..utils import Utils
+from ..device_base import DeviceBase, _WAKEUP_PREAMBLES, _WAKEUP_PREAMBLES_DEFAULT, _SCOPE_FLAG_DATA, _SCOPE_SPAN_BYTES, _RAW_TO_PERCENT, _PERCENT_TO_RAW, _MEMORY_CHANNEL_BYTES, _mode_name, _filter_name
+from ..utils import BaseUtils, Utils, AsyncUtils, _dec_bcd_le
 
 logger = logging.getLogger("iu2frl-civ")
 
+_FREQ_MIN = 10_000  # Lowest frequency of the IC-7300 in Hz
+_FREQ_MAX = 74_000_000  # Highest frequency of the IC-7300 in Hz
+
+# Meter calibration points from the manual (raw value, measured value)
+_PO_POINTS = ((0, 0), (143, 50), (213, 100))  # raw -> PO%
+_SWR_POINTS = ((0, 1), (48, 1.5), (80, 2.0), (120, 3.0), (255, 99))  # raw -> SWR
+_ALC_POINTS = ((0, 0), (120, 100))  # raw -> ALC%
+_COMP_POINTS = ((0, 0), (130, 15), (241, 30))  # raw -> dB
+_VD_POINTS = ((0, 0), (13, 10), (241, 16))  # raw -> V
+_ID_POINTS = ((0, 0), (97, 10), (146, 15), (241, 25))  # raw -> A
+
+# Meters read by read_meters: name -> (command, calibration points)
+_METERS = {
+    "smeter": (b"\x15\x02", None),
+    "po": (b"\x15\x11", _PO_POINTS),
+    "swr": (b"\x15\x12", _SWR_POINTS),
+    "alc": (b"\x15\x13", _ALC_POINTS),
+    "comp": (b"\x15\x14", _COMP_POINTS),
+    "vd": (b"\x15\x15", _VD_POINTS),
+    "id": (b"\x15\x16", _ID_POINTS),
+}
+
+
+# Checks and parsing shared by IC7300 and AsyncIC7300
+def _check_frequency(frequency_hz: int | float) -> int:
+    """Convert the frequency to an integer (for scientific notation ex: 14.074e6) and check it is in range"""
+    frequency_hz = int(frequency_hz)
+    if not (_FREQ_MIN <= frequency_hz <= _FREQ_MAX):
+        raise ValueError("Frequency must be between 10 kHz and 74 MHz")
+    return frequency_hz
+
+
+def _parse_frequency(reply: bytes) -> int:
+    """Frequency in Hz of a reply to command 0x03, -1 if the reply is too short"""
+    if len(reply) < 11:
+        return -1
+    return _dec_bcd_le(reply, 5, 5)
+
+
+def _parse_mode(reply: bytes) -> Tuple[str, str]:
+    """Mode and filter names of a reply to command 0x04"""
+    if len(reply) == 8:
+        return [_mode_name(reply[5]), _filter_name(reply[6])]
+    return ["ERR", "ERR"]
+
+
+def _parse_meter(utils: BaseUtils, reply: bytes, points=None) -> float:
+    """
+    Parse the reply of a meter reading
+
+    Returns: the value converted using the calibration points (raw value if not specified), -1 in case of error
+    """
+    if len(reply) != 9:
+        return -1
+    raw_value = utils.bytes_to_int(reply[6], reply[7])
+    if points is None:
+        return raw_value
+    return utils.linear_interpolate(raw_value, points)
+
 
 class IC7300(DeviceBase):
     """Create a CI-V object to interact with a generic the radio transceiver"""
@@ -37,6 +96,9 @@ class IC7300(DeviceBase):
         '^',   # Symbol
         '*'
     ]
+    # Same character sets as bytes, to validate the encoded text in a single bytes.translate call
+    _MEMORY_NAME_BYTES = "".join(allowed_memory_Name_characters).encode("ascii")
+    _MEMORY_KEYER_BYTES = "".join(memory_keyer_characters).encode("ascii")
 
     def __init__(self, *args, **kwargs) -> None:
         """Initialize the IC7300 object"""
@@ -49,9 +111,7 @@ class IC7300(DeviceBase):
 
         Returns: the response from the transceiver
         """
-        # Preamble counts for different baudrates
-        preamble_counts = {115200: 150, 57600: 75, 38400: 50, 19200: 25, 9600: 13}
-        wakeup_preamble_count = preamble_counts.get(self._ser.baudrate, 7)
+        wakeup_preamble_count = _WAKEUP_PREAMBLES.get(self._ser.baudrate, _WAKEUP_PREAMBLES_DEFAULT)
         logger.debug("Sending power-on command with %i wakeup preambles", wakeup_preamble_count)
         return self.utils.send_command(b"\x18\x01", preamble=b"\xfe" * wakeup_preamble_count)
 
@@ -81,9 +141,8 @@ class IC7300(DeviceBase):
         Returns: the currently tuned frequency in Hz
         """
         try:
-            reply = self.utils.send_command(b"\x03")
-            return self.utils.decode_frequency(reply[5:10])
-        except:
+            return _parse_frequency(self.utils.send_command(b"\x03"))
+        except Exception:
             return -1
 
     def read_operating_mode(self) -> Tuple[str, str]:
@@ -94,13 +153,7 @@ class IC7300(DeviceBase):
             - the current mode
             - the current filter
         """
-        reply = self.utils.send_command(b"\x04")
-        if len(reply) == 8:
-            mode = OperatingMode(int(reply[5:6].hex())).name
-            fil = SelectedFilter(int(reply[6:7].hex())).name
-            return [mode, fil]
-        else:
-            return ["ERR", "ERR"]
+        return _parse_mode(self.utils.send_command(b"\x04"))
 
     def send_operating_frequency(self, frequency_hz: int | float) -> bool:
         """
@@ -108,12 +161,7 @@ class IC7300(DeviceBase):
 
         Returns: True if the frequency was properly sent
         """
-        if isinstance(frequency_hz, float):  # fix for using scientific notation ex: 14.074e6
-            frequency_hz = int(frequency_hz)
-
-        # Validate input
-        if not (10_000 <= frequency_hz <= 74_000_000):  # IC-7300 frequency range in Hz
-            raise ValueError("Frequency must be between 10 kHz and 74 MHz")
+        frequency_hz = _check_frequency(frequency_hz)
         # Encode the frequency
         data = self.utils.encode_frequency(frequency_hz)
 
@@ -137,7 +185,7 @@ class IC7300(DeviceBase):
         reply = self.utils.send_command(b"\x14\x01")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            return self.utils.convert_to_range(raw_value, 0, 255, 0, 100)
+            return _RAW_TO_PERCENT(raw_value)
         return -1
 
     def read_rf_gain(self) -> int:
@@ -153,7 +201,7 @@ class IC7300(DeviceBase):
         reply = self.utils.send_command(b"\x14\x02")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            return self.utils.convert_to_range(raw_value, 0, 255, 0, 100)
+            return _RAW_TO_PERCENT(raw_value)
         return -1
 
     def read_squelch_level(self) -> int:
@@ -169,7 +217,7 @@ class IC7300(DeviceBase):
         reply = self.utils.send_command(b"\x14\x03")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            return self.utils.convert_to_range(raw_value, 0, 255, 0, 100)
+            return _RAW_TO_PERCENT(raw_value)
         return -1
 
     def read_nr_level(self) -> int:
@@ -185,7 +233,7 @@ class IC7300(DeviceBase):
         reply = self.utils.send_command(b"\x14\x06")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            return self.utils.convert_to_range(raw_value, 0, 255, 0, 100)
+            return _RAW_TO_PERCENT(raw_value)
         return -1
 
     def read_nb_level(self) -> float:
@@ -201,7 +249,7 @@ class IC7300(DeviceBase):
         reply = self.utils.send_command(b"\x14\x12")
         if len(reply) == 9:
             raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            return self.utils.convert_to_range(raw_value, 0, 255, 0, 100)
+            return _RAW_TO_PERCENT(raw_value)
         return -1
 
     def read_smeter(self) -> int:
@@ -215,10 +263,7 @@ class IC7300(DeviceBase):
 
         TODO: test if properly working
         """
-        reply = self.utils.send_command(b"\x15\x02")
-        if len(reply) == 9:
-            return self.utils.bytes_to_int(reply[6], reply[7])
-        return -1
+        return _parse_meter(self.utils, self.utils.send_command(b"\x15\x02"))
 
     def read_squelch_status(self):
         """
@@ -251,13 +296,7 @@ class IC7300(DeviceBase):
         143: 50%
         213: 100%
         """
-        reply = self.utils.send_command(b"\x15\x11")
-        if len(reply) == 9:
-            raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            # Known points (raw -> PO%)
-            points = [(0, 0), (143, 50), (213, 100)]
-            return self.utils.linear_interpolate(raw_value, points)
-        return -1
+        return _parse_meter(self.utils, self.utils.send_command(b"\x15\x11"), _PO_POINTS)
 
     def read_swr_meter(self) -> float:
         """
@@ -267,13 +306,7 @@ class IC7300(DeviceBase):
         80: SWR2.0,
         120: SWR3.0
         """
-        reply = self.utils.send_command(b"\x15\x12")
-        if len(reply) == 9:
-            raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            # Known points (raw -> SWR)
-            points = [(0, 1), (48, 1.5), (80, 2.0), (120, 3.0), (255, 99)]
-            return self.utils.linear_interpolate(raw_value, points)
-        return -1
+        return _parse_meter(self.utils, self.utils.send_command(b"\x15\x12"), _SWR_POINTS)
 
     def read_alc_meter(self) -> float:
         """
@@ -281,13 +314,7 @@ class IC7300(DeviceBase):
         0: Min
         120: Max
         """
-        reply = self.utils.send_command(b"\x15\x13")
-        if len(reply) == 9:
-            raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            # Known points (raw -> ALC%)
-            points = [(0, 0), (120, 100)]
-            return self.utils.linear_interpolate(raw_value, points)
-        return -1
+        return _parse_meter(self.utils, self.utils.send_command(b"\x15\x13"), _ALC_POINTS)
 
     def read_comp_meter(self) -> float:
         """
@@ -296,13 +323,7 @@ class IC7300(DeviceBase):
         130: 15 dB,
         241: 30 dB
         """
-        reply = self.utils.send_command(b"\x15\x14")
-        if len(reply) == 9:
-            raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            # Known points (raw -> dB)
-            points = [(0, 0), (130, 15), (241, 30)]
-            return self.utils.linear_interpolate(raw_value, points)
-        return -1
+        return _parse_meter(self.utils, self.utils.send_command(b"\x15\x14"), _COMP_POINTS)
 
     def read_vd_meter(self) -> float:
         """
@@ -316,13 +337,7 @@ class IC7300(DeviceBase):
         Returns:
             float: The voltage in volts measured on the amplifier.
         """
-        reply = self.utils.send_command(b"\x15\x15")
-        if len(reply) == 9:
-            raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            # Known points (raw -> A)
-            points = [(0, 0), (13, 10), (241, 16)]
-            return self.utils.linear_interpolate(raw_value, points)
-        return -1.0  # Return -1 in case of error
+        return _parse_meter(self.utils, self.utils.send_command(b"\x15\x15"), _VD_POINTS)
 
     def read_id_meter(self) -> float:
         """
@@ -336,20 +351,23 @@ class IC7300(DeviceBase):
 
         Returns: the current in Ampere being mesured on the amplifier
         """
-        reply = self.utils.send_command(b"\x15\x16")
-        if len(reply) == 9:
-            raw_value = self.utils.bytes_to_int(reply[6], reply[7])
-            # List of known points (from the manual - byte -> Ampere)
-            points = [(0, 0), (97, 10), (146, 15), (241, 25)]
-            return self.utils.linear_interpolate(raw_value, points)
-        return -1.0  # Return -1 in case of error
+        return _parse_meter(self.utils, self.utils.send_command(b"\x15\x16"), _ID_POINTS)
+
+    def read_meters(self) -> dict:
+        """
+        Read the S, PO, SWR, ALC, COMP, Vd and Id meters using a single serial transaction
+
+        All the commands are written at once and the replies are read back together,
+        instead of paying a full round-trip for each of the read_*_meter methods.
+
+        Returns: a dictionary with the meter names as keys and the same values returned by each read_* method
+        """
+        replies = self.utils.send_commands([(command, b"") for command, _ in _METERS.values()])
+        return {name: _parse_meter(self.utils, reply, points) for (name, (_, points)), reply in zip(_METERS.items(), replies)}
 
     def set_antenna_tuner(self, on: bool):
         """Turns the antenna tuner on or off."""
-        if on:
-            self.utils.send_command(b"\x1C\x01", b"\x01")  # Turn tuner ON
-        else:
-            self.utils.send_command(b"\x1C\x01", b"\x00")  # Turn tuner OFF
+        self._send_flag(b"\x1C\x01", on)
 
     def tune_antenna_tuner(self):
         """Starts the antenna tuner tuning process."""
@@ -361,10 +379,10 @@ class IC7300(DeviceBase):
 
     def send_cw_message(self, message: str):
         """Send a CW message. Limited to 30 characters"""
-        if len(message) > 30:
-            raise ValueError("Message must be 30 characters or less")
         # convert the string to bytes
         message_bytes = message.encode("ascii")
+        if len(message_bytes) > 30:
+            raise ValueError("Message must be 30 characters or less")
         self.utils.send_command(b"\x17", data=message_bytes)
 
     def set_ip_plus_function(self, enable: bool) -> bool:
@@ -377,8 +395,7 @@ class IC7300(DeviceBase):
         Returns:
             bool: True if the command was successful, False otherwise.
         """
-        value = 1 if enable else 0
-        reply = self.utils.send_command(b"\x1a\x07", data=bytes([value]))
+        reply = self._send_flag(b"\x1a\x07", enable)
         return len(reply) > 0
 
     def set_mf_band_attenuator(self, enable: bool) -> bool:
@@ -391,13 +408,13 @@ class IC7300(DeviceBase):
         Returns:
             bool: True if the command was successful, False otherwise.
         """
-        reply = self.utils.send_command(b"\x1a\x05\x01\x93", data=bytes([int(enable)]))
+        reply = self._send_flag(b"\x1a\x05\x01\x93", enable)
         return len(reply) > 0
 
     def set_vfo_mode(self, vfo_mode: VFOOperation = VFOOperation.SELECT_VFO_A):
         """Sets the VFO mode."""
         if vfo_mode in VFOOperation:
-            self.utils.send_command(b"\x07", data=vfo_mode.value)
+            self.utils.send_command(b"\x07", data=vfo_mode)
         else:
             raise ValueError("Invalid vfo_mode")
 
@@ -408,23 +425,11 @@ class IC7300(DeviceBase):
         # 0001 to 0109 Select the Memory channel *(0001=M-CH01, 0099=M-CH99)
         # 0100 Select program scan edge channel P1
         # 0101 Select program scan edge channel P2
-
-        if 0 < memory_channel < 100:
-            hex_list = ["0x00"]
-        elif memory_channel in [100, 101]:
-            hex_list = ["0x01"]
-        else:
-            raise ValueError("Memory channel must be between 1 and 101")
-        number_as_string = str(memory_channel).rjust(3, "0")
-        hex_list.append(f"0x{number_as_string[1]}{number_as_string[2]}")
-        self.utils.send_command(b"\x08", data=bytes([int(hx, 16) for hx in hex_list]))
+        self.utils.send_command(b"\x08", data=_MEMORY_CHANNEL_BYTES[memory_channel])
 
     def set_mox(self, transmit: bool):
         """Turns the MOX on or off"""
-        if transmit:
-            self.utils.send_command(b"\x1C\x00", b"\x01")
-        else:
-            self.utils.send_command(b"\x1C\x00", b"\x00")
+        self._send_flag(b"\x1C\x00", transmit)
 
     def set_lcd_brightness(self, level: int):
         """Sets the LCD brightness, from 0 to 255"""
@@ -435,36 +440,24 @@ class IC7300(DeviceBase):
 
     def set_display_font(self, round_font: bool = True):
         """Set the display font"""
-        if round_font:
-            self.utils.send_command(b"\x1A\x05\x00\x83", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x00\x83", b"\x00")
+        self._send_flag(b"\x1A\x05\x00\x83", round_font)
 
     def set_scope_mode_fixed(self, fixed_mode: bool = False):
         """Sets the scope mode, True for Fixed, False for Center"""
-        if fixed_mode:
-            self.utils.send_command(b"\x27\x14", b"\x00\x01")
-        else:
-            self.utils.send_command(b"\x27\x14", b"\x00\x00")
+        self._send_flag(b"\x27\x14", fixed_mode, _SCOPE_FLAG_DATA)
 
     def set_scope_enabled(self, enabled: bool) -> bool:
         """
         Set the Scope ON/OFF status
         """
-        if enabled:
-            self.utils.send_command(b"\x27\x10", b"\x01")
-        else:
-            self.utils.send_command(b"\x27\x10", b"\x00")
+        self._send_flag(b"\x27\x10", enabled)
         return True
 
     def set_scope_data_out(self, enabled: bool) -> bool:
         """
         Enables scope data output to the COM port
         """
-        if enabled:
-            self.utils.send_command(b"\x27\x11", b"\x01")
-        else:
-            self.utils.send_command(b"\x27\x11", b"\x00")
+        self._send_flag(b"\x27\x11", enabled)
         return True
 
     def set_scope_span(self, span_hz: int):
@@ -473,11 +466,9 @@ class IC7300(DeviceBase):
         Valid values are: 2500, 5000, 10000, 25000, 50000, 100000, 250000, 500000
         Example: 50000 => ±50000Hz => 100000Hz
         """
-        valid_values = [2500, 5000, 10000, 25000, 50000, 100000, 250000, 500000]
-        if span_hz not in valid_values:
+        span_bytes = _SCOPE_SPAN_BYTES.get(span_hz)
+        if span_bytes is None:
             raise ValueError(f"Invalid value: {span_hz}")
-        span_bytes = b"\x00"
-        span_bytes += self.utils.encode_frequency(span_hz)
         self.utils.send_command(b"\x27\x15", data=span_bytes)
 
     def set_scope_sweep_speed(self, speed: int):
@@ -495,10 +486,7 @@ class IC7300(DeviceBase):
 
     def set_display_image_type(self, blue_background: bool = True):
         """Set display image type"""
-        if blue_background:
-            self.utils.send_command(b"\x1A\x05\x00\x82", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x00\x82", b"\x00")
+        self._send_flag(b"\x1A\x05\x00\x82", blue_background)
 
     def clear_current_memory(self):
         """Clears the current memory"""
@@ -519,8 +507,7 @@ class IC7300(DeviceBase):
         """
         if not (1 <= depth <= 10):
             raise ValueError("Depth must be between 1 and 10")
-        reply = self.utils.send_command(b"\x1a\x05\x01\x89", data=bytes([depth - 1]))
-        return len(reply) > 0
+        return self._send_setting(b"\x1a\x05\x01\x89", depth - 1)
 
     def set_nb_width(self, width: int) -> bool:
         """
@@ -537,7 +524,7 @@ class IC7300(DeviceBase):
         """
         if not (0 <= width <= 100):
             raise ValueError("Width must be between 0 and 100")
-        width = int(self.utils.convert_to_range(width, 0, 100, 0, 255))
+        width = int(_PERCENT_TO_RAW(width))
         width_bytes = self.utils.encode_int_to_icom_bytes(width)
         reply = self.utils.send_command(b"\x1a\x05\x01\x90", data=width_bytes)
         return len(reply) > 0
@@ -580,8 +567,7 @@ class IC7300(DeviceBase):
         """
         if not (0 <= delay <= 20):
             raise ValueError("Delay must be between 0 and 20")
-        reply = self.utils.send_command(b"\x1a\x05\x01\x91", data=bytes([delay]))
-        return len(reply) > 0
+        return self._send_setting(b"\x1a\x05\x01\x91", delay)
 
     def set_vox_voice_delay(self, voice_delay: int) -> bool:
         """
@@ -602,8 +588,7 @@ class IC7300(DeviceBase):
         """
         if not (0 <= voice_delay <= 3):
             raise ValueError("Value must be between 0 and 3")
-        reply = self.utils.send_command(b"\x1a\x05\x01\x92", data=bytes([voice_delay]))
-        return len(reply) > 0
+        return self._send_setting(b"\x1a\x05\x01\x92", voice_delay)
 
     def start_scan(self, scan_type: ScanMode = ScanMode.SELECT_DF_SPAN_100KHZ):
         """
@@ -614,47 +599,34 @@ class IC7300(DeviceBase):
             an exception is returned
         """
         if scan_type in ScanMode:
-            self.utils.send_command(b"\x0E", data=scan_type.value)
+            self.utils.send_command(b"\x0E", data=scan_type)
         else:
             raise ValueError("Invalid scan type")
 
     def set_scan_speed(self, high: bool):
         """Sets the scan speed"""
-        if high:
-            self.utils.send_command(b"\x1A\x05\x01\x78", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x01\x78", b"\x00")
+        self._send_flag(b"\x1A\x05\x01\x78", high)
 
     def set_scope_reference_level(self, level: float):
         """Sets the scope reference level, range is -20.0 to +20.0 dB in 0.5 dB steps"""
         if not (-20.0 <= level <= 20.0):
             raise ValueError("Level must be between -20.0 and +20.0 dB")
-        if level % 0.5 != 0:
+        half_steps = round(level * 2)
+        if half_steps != level * 2:
             raise ValueError("Level must be in 0.5 dB increments")
 
-        # Convert the level to the required format
-        level_bytes = b"\x00"
-        level_bytes += self.utils.encode_int_to_icom_bytes(abs(level * 100))
-        if level >= 0:
-            level_bytes += b"\x00"
-        else:
-            level_bytes += b"\x01"
+        # Main scope, absolute level in 0.01 dB (BCD) and sign
+        level_bytes = b"\x00" + self.utils.encode_int_to_icom_bytes(abs(half_steps) * 50) + (b"\x01" if half_steps < 0 else b"\x00")
 
         self.utils.send_command(b"\x27\x19", data=level_bytes)
 
     def set_scope_vbw(self, wide: bool = True):
         """Sets the scope VBW (Video Band Width), True for wide, false for narrow"""
-        if wide:
-            self.utils.send_command(b"\x27\x1D", b"\x00\x01")
-        else:
-            self.utils.send_command(b"\x27\x1D", b"\x00\x00")
+        self._send_flag(b"\x27\x1D", wide, _SCOPE_FLAG_DATA)
 
     def set_scope_waterfall_display(self, on: bool):
         """Turns the waterfall display on or off for the scope"""
-        if on:
-            self.utils.send_command(b"\x1A\x05\x01\x07", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x01\x07", b"\x00")
+        self._send_flag(b"\x1A\x05\x01\x07", on)
 
     def set_memory_keyer_message(self, channel: int, text: str) -> bool:
         """
@@ -676,12 +648,11 @@ class IC7300(DeviceBase):
         if not 1 <= channel <= 8:
             raise ValueError("Channel number must be between 1 and 8")
 
-        encoded_text = channel.to_bytes(1, 'big')
-        for char in text:
-            if char in self.memory_keyer_characters:
-                encoded_text += bytes([ord(char)])
-            else:
-                raise ValueError(f"Invalid character: {char}")
+        text_bytes = text.encode("ascii")
+        invalid_bytes = text_bytes.translate(None, self._MEMORY_KEYER_BYTES)
+        if invalid_bytes:
+            raise ValueError(f"Invalid character: {chr(invalid_bytes[0])}")
+        encoded_text = channel.to_bytes(1, 'big') + text_bytes
         
         command = b'\x1a\x02'
 
@@ -805,7 +776,7 @@ class IC7300(DeviceBase):
         level by voice synthesizer
         02 Speech the operating mode by voice synthesizer
         """
-        if speech_type in [1, 2]:
+        if speech_type in (0, 1, 2):
             self.utils.send_command(b"\x13", data=bytes([speech_type]))
         else:
             raise ValueError("Invalid speech type")
@@ -819,17 +790,11 @@ class IC7300(DeviceBase):
 
     def set_speech_language(self, english: bool = True):
         """Sets the speech language, True for english, false for japanese"""
-        if english:
-            self.utils.send_command(b"\x1A\x05\x00\x39", b"\x00")
-        else:
-            self.utils.send_command(b"\x1A\x05\x00\x39", b"\x01")
+        self._send_flag(b"\x1A\x05\x00\x39", not english)
 
     def set_speech_speed(self, high: bool = True):
         """Sets the speech speed"""
-        if high:
-            self.utils.send_command(b"\x1A\x05\x00\x40", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x00\x40", b"\x00")
+        self._send_flag(b"\x1A\x05\x00\x40", high)
 
     def read_band_edge_frequencies(self):
         """
@@ -857,7 +822,7 @@ class IC7300(DeviceBase):
         edge_number is 1, 2, or 3
         lower_frequency and higher_frequency are in Hz
         """
-        if edge_number not in [1 - 3]:
+        if edge_number not in (1, 2, 3):
             raise ValueError("Edge number must be 1, 2, or 3")
 
         if not (10_000 <= lower_frequency <= 74_000_000) or not (10_000 <= higher_frequency <= 74_000_000):
@@ -878,20 +843,15 @@ class IC7300(DeviceBase):
         """
         if not (1 <= memory_channel <= 99):
             raise ValueError("Memory channel must be between 1 and 99")
-        if len(name) > 10:
+        # convert the string to bytes
+        name_bytes = name.encode("ascii")
+        if len(name_bytes) > 10:
             raise ValueError("Memory name must be 10 characters or less")
 
         # Convert the memory channel to a byte array
-        channel_bytes = memory_channel.to_bytes(2, "big")
-        # convert the string to bytes
-        name_bytes = b""
-
-        for char in name:
-            name_bytes += bytes([ord(char)])
-
-        # pad the name with spaces if it is less than 10
-        while len(name_bytes) < 10:
-            name_bytes += b"\x20"
+        channel_bytes = _MEMORY_CHANNEL_BYTES[memory_channel]
+        # pad the name with spaces to 10 characters
+        name_bytes = name_bytes.ljust(10, b" ")
 
         data = channel_bytes + b"\x00" + b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00" + name_bytes
 
@@ -899,71 +859,47 @@ class IC7300(DeviceBase):
 
     def set_rtty_mark_frequency(self, frequency: int):
         """Sets the RTTY mark frequency, 0=1275 Hz, 1=1615 Hz, 2=2125 Hz"""
-        if frequency not in [1, 2]:
+        if frequency not in (0, 1, 2):
             raise ValueError("Invalid RTTY mark frequency")
         self.utils.send_command(b"\x1A\x05\x00\x36", data=bytes([frequency]))
 
     def set_rtty_shift_width(self, width: int):
         """Sets the RTTY shift width, 0=170 Hz, 1=200 Hz, 2=425 Hz"""
-        if width not in [1, 2]:
+        if width not in (0, 1, 2):
             raise ValueError("Invalid RTTY shift width")
         self.utils.send_command(b"\x1A\x05\x00\x37", data=bytes([width]))
 
     def set_rtty_keying_polarity(self, reverse: bool = False):
         """Sets the RTTY keying polarity, True for reverse, False for normal"""
-        if reverse:
-            self.utils.send_command(b"\x1A\x05\x00\x38", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x00\x38", b"\x00")
+        self._send_flag(b"\x1A\x05\x00\x38", reverse)
 
     def set_rtty_decode_usos(self, on: bool = False):
         """Set RTTY decode USOS"""
-        if on:
-            self.utils.send_command(b"\x1A\x05\x01\x68", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x01\x68", b"\x00")
+        self._send_flag(b"\x1A\x05\x01\x68", on)
 
     def set_rtty_decode_newline_code(self, crlf: bool = True):
         """Set RTTY decode new line code"""
-        if crlf:
-            self.utils.send_command(b"\x1A\x05\x01\x69", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x01\x69", b"\x00")
+        self._send_flag(b"\x1A\x05\x01\x69", crlf)
 
     def set_rtty_tx_usos(self, on: bool = False):
         """Sets RTTY tx USOS"""
-        if on:
-            self.utils.send_command(b"\x1A\x05\x01\x70", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x01\x70", b"\x00")
+        self._send_flag(b"\x1A\x05\x01\x70", on)
 
     def set_rtty_log(self, on: bool = False):
         """Set RTTY log function"""
-        if on:
-            self.utils.send_command(b"\x1A\x05\x01\x73", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x01\x73", b"\x00")
+        self._send_flag(b"\x1A\x05\x01\x73", on)
 
     def set_rtty_log_file_format(self, html: bool = False):
         """Set the file format for the RTTY log, True for HTML, False for text"""
-        if html:
-            self.utils.send_command(b"\x1A\x05\x01\x74", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x01\x74", b"\x00")
+        self._send_flag(b"\x1A\x05\x01\x74", html)
 
     def set_rtty_log_time_stamp(self, on: bool = False):
         """Set RTTY time stamp"""
-        if on:
-            self.utils.send_command(b"\x1A\x05\x01\x75", b"\x01")
-        else:
-            self.utils.send_command(b"\x1A\x05\x01\x75", b"\x00")
+        self._send_flag(b"\x1A\x05\x01\x75", on)
 
     def set_rtty_log_time_stamp_local(self, local: bool = True):
         """Set the RTTY Log Time Stamp local or UTC"""
-        if local:
-            self.utils.send_command(b"\x1A\x05\x01\x76", b"\x00")
-        else:
-            self.utils.send_command(b"\x1A\x05\x01\x76", b"\x01")
+        self._send_flag(b"\x1A\x05\x01\x76", not local)
 
     def set_rtty_log_frequency_stamp(self, enable: bool) -> bool:
         """
@@ -975,8 +911,7 @@ class IC7300(DeviceBase):
         Returns:
             bool: True if the command was successful, False otherwise.
         """
-        value = 1 if enable else 0
-        reply = self.utils.send_command(b"\x1a\x05\x01\x77", data=bytes([value]))
+        reply = self._send_flag(b"\x1a\x05\x01\x77", enable)
         return len(reply) > 0
 
     def set_auto_monitor_voice_memory(self, enable: bool) -> bool:
@@ -989,8 +924,7 @@ class IC7300(DeviceBase):
         Returns:
             bool: True if the command was successful, False otherwise.
         """
-        value = 1 if enable else 0
-        reply = self.utils.send_command(b"\x1a\x05\x01\x80", data=bytes([value]))
+        reply = self._send_flag(b"\x1a\x05\x01\x80", enable)
         return len(reply) > 0
 
     def set_repeat_interval_voice_memory(self, interval: int) -> bool:
@@ -1008,8 +942,7 @@ class IC7300(DeviceBase):
         """
         if not (1 <= interval <= 15):
             raise ValueError("Interval must be between 1 and 15 seconds")
-        reply = self.utils.send_command(b"\x1a\x05\x01\x81", data=bytes([interval]))
-        return len(reply) > 0
+        return self._send_setting(b"\x1a\x05\x01\x81", interval)
 
     def set_qso_recorder_mode(self, tx_rx: bool) -> bool:
         """
@@ -1021,8 +954,7 @@ class IC7300(DeviceBase):
         Returns:
             bool: True if the command was successful, False otherwise.
         """
-        value = 0 if tx_rx else 1
-        reply = self.utils.send_command(b"\x1a\x05\x01\x82", data=bytes([value]))
+        reply = self._send_flag(b"\x1a\x05\x01\x82", not tx_rx)
         return len(reply) > 0
 
     def set_qso_recorder_tx_audio(self, mic_audio: bool) -> bool:
@@ -1035,8 +967,7 @@ class IC7300(DeviceBase):
         Returns:
             bool: True if the command was successful, False otherwise.
         """
-        value = 0 if mic_audio else 1
-        reply = self.utils.send_command(b"\x1a\x05\x01\x83", data=bytes([value]))
+        reply = self._send_flag(b"\x1a\x05\x01\x83", not mic_audio)
         return len(reply) > 0
 
     def set_qso_recorder_squelch_relation(self, always_record: bool) -> bool:
@@ -1049,8 +980,7 @@ class IC7300(DeviceBase):
         Returns:
             bool: True if the command was successful, False otherwise.
         """
-        value = 0 if always_record else 1
-        reply = self.utils.send_command(b"\x1a\x05\x01\x84", data=bytes([value]))
+        reply = self._send_flag(b"\x1a\x05\x01\x84", not always_record)
         return len(reply) > 0
 
     def set_qso_record_file_split(self, enable: bool) -> bool:
@@ -1063,8 +993,7 @@ class IC7300(DeviceBase):
         Returns:
             bool: True if the command was successful, False otherwise.
         """
-        value = 1 if enable else 0
-        reply = self.utils.send_command(b"\x1a\x05\x01\x85", data=bytes([value]))
+        reply = self._send_flag(b"\x1a\x05\x01\x85", enable)
         return len(reply) > 0
 
     def set_ptt_automatic_recording(self, enable: bool) -> bool:
@@ -1077,8 +1006,7 @@ class IC7300(DeviceBase):
         Returns:
             bool: True if the command was successful, False otherwise.
         """
-        value = 1 if enable else 0
-        reply = self.utils.send_command(b"\x1a\x05\x01\x86", data=bytes([value]))
+        reply = self._send_flag(b"\x1a\x05\x01\x86", enable)
         return len(reply) > 0
 
     def set_ptt_automatic_recording_rx_audio(self, rx_audio_time: int) -> bool:
@@ -1100,8 +1028,7 @@ class IC7300(DeviceBase):
         """
         if not (0 <= rx_audio_time <= 3):
             raise ValueError("Value must be between 0 and 3")
-        reply = self.utils.send_command(b"\x1a\x05\x01\x87", data=bytes([rx_audio_time]))
-        return len(reply) > 0
+        return self._send_setting(b"\x1a\x05\x01\x87", rx_audio_time)
 
     def set_qso_play_skip_time(self, skip_time: int) -> bool:
         """
@@ -1122,8 +1049,7 @@ class IC7300(DeviceBase):
         """
         if not (0 <= skip_time <= 3):
             raise ValueError("Value must be between 0 and 3")
-        reply = self.utils.send_command(b"\x1a\x05\x01\x88", data=bytes([skip_time]))
-        return len(reply) > 0
+        return self._send_setting(b"\x1a\x05\x01\x88", skip_time)
 
     def set_memory(
         self,
@@ -1169,9 +1095,6 @@ class IC7300(DeviceBase):
         if not 1 <= memory_channel <= 99:
             raise ValueError("Memory channel must be between 1 and 99")
 
-        # Format memory channel
-        memory_channel_str = f"{memory_channel:04d}" #aggiunge zeri iniziali
-
         # Validate frequency
         if not 10_000_000 <= frequency_hz <= 74_800_000:
             raise ValueError("Frequency must be between 10,000,000 and 74,800,000 Hz")
@@ -1204,24 +1127,20 @@ class IC7300(DeviceBase):
         squelch_bytes = bytes([0]) * (3 - len(squelch_bytes)) + squelch_bytes  # pad with leading zeros to 3 bytes
 
         # Convert memory name to bytes
-        if len(memory_name) > 10:
+        memory_name_bytes = memory_name.encode("ascii")
+        if len(memory_name_bytes) > 10:
             raise ValueError("Memory name must be 10 characters or less")
         # Validate if all characters are in the allowed list
-        for char in memory_name:
-            if char not in self.allowed_memory_Name_characters:
-                raise ValueError(f"Invalid character '{char}' in memory name")
-
-        memory_name_bytes = b""
-        for char in memory_name:
-            memory_name_bytes += bytes([ord(char)]) #converte i caratteri in ascii
+        invalid_bytes = memory_name_bytes.translate(None, self._MEMORY_NAME_BYTES)
+        if invalid_bytes:
+            raise ValueError(f"Invalid character '{chr(invalid_bytes[0])}' in memory name")
 
         # Pad the memory name with spaces if less than 10 characters
-        memory_name_bytes += b' ' * (10 - len(memory_name))
+        memory_name_bytes = memory_name_bytes.ljust(10, b" ")
 
         # Format the full command data
         command_data = (
-            bytes([int(memory_channel_str[0:2])])
-            + bytes([int(memory_channel_str[2:4])])
+            _MEMORY_CHANNEL_BYTES[memory_channel]
             + bytes([memory_setting]) # star
             + frequency_bytes
             + mode_byte
@@ -1236,6 +1155,80 @@ class IC7300(DeviceBase):
         reply = self.utils.send_command(b'\x1a\x00', data=command_data)
         return len(reply) > 0
 
+
+class AsyncIC7300:
+    """
+    Create an asyncio CI-V object to interact with an IC-7300 transceiver
+
+    Requires the `pyserial-asyncio` package, instances must be created with `await AsyncIC7300.create(...)`.
+    The frames are still sent one at a time, but the event loop is free to run
+    other tasks (like parsing the previous reply) while waiting for the transceiver.
+    """
+
+    def __init__(self, utils: AsyncUtils):
+        self.utils = utils
+
+    @classmethod
+    async def create(cls, radio_address: str, port="/dev/ttyUSB0", baudrate: int = 19200, debug=False, controller_address="0xE0", timeout=1, attempts=3) -> "AsyncIC7300":
+        """Open the serial port and return the device object"""
+        utils = await AsyncUtils.open(radio_address, port, baudrate, controller_address, attempts, timeout=timeout, debug=debug)
+        return cls(utils)
+
+    def close(self):
+        """Close the serial port"""
+        self.utils.close()
+
+    async def read_operating_frequency(self) -> int:
+        """
+        Read the operating frequency
+
+        Returns: the currently tuned frequency in Hz, -1 if the reply is too short
+        """
+        return _parse_frequency(await self.utils.send_command_async(b"\x03"))
+
+    async def read_operating_mode(self) -> Tuple[str, str]:
+        """
+        Read the operating mode
+
+        Returns: a tuple containing
+            - the current mode
+            - the current filter
+        """
+        return _parse_mode(await self.utils.send_command_async(b"\x04"))
+
+    async def send_operating_frequency(self, frequency_hz: int | float) -> bool:
+        """
+        Send the operating frequency
+
+        Returns: True if the frequency was properly sent
+        """
+        frequency_hz = _check_frequency(frequency_hz)
+        reply = await self.utils.send_command_async(b"\x05", data=self.utils.encode_frequency(frequency_hz))
+        return len(reply) > 0
+
+    async def set_operating_mode(self, mode: OperatingMode, new_filter: SelectedFilter = SelectedFilter.FIL1):
+        """Sets the operating mode and filter."""
+        await self.utils.send_command_async(b"\x06", data=bytes([mode.value, new_filter.value]))
+
+    async def read_meter(self, name: str) -> float:
+        """
+        Read a single meter, by the same names used by `read_meters`
+
+        Returns: the same value returned by the corresponding IC7300.read_* method
+        """
+        command, points = _METERS[name]
+        return _parse_meter(self.utils, await self.utils.send_command_async(command), points)
+
+    async def read_meters(self) -> dict:
+        """
+        Read the S, PO, SWR, ALC, COMP, Vd and Id meters using a single serial transaction
+
+        Returns: a dictionary with the meter names as keys and the same values returned by each read_* method
+        """
+        replies = await self.utils.send_commands_async([(command, b"") for command, _ in _METERS.values()])
+        return {name: _parse_meter(self.utils, reply, points) for (name, (_, points)), reply in zip(_METERS.items(), replies)}
+
+
 # Required attributes for plugin discovery
 device_type = DeviceType.IC_7300
 device_class = IC7300
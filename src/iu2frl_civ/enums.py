@@ -38,7 +38,7 @@ class SquelchStatus(Enum):
     OPEN = 1
 
 
-class ScanMode(Enum):
+class ScanMode(bytes, Enum):
     """Scan mode of the transceiver"""
 
     STOP = b"\x00"  # Stop scan
@@ -63,7 +63,7 @@ class ScanMode(Enum):
     SCAN_RESUME_ON = b"\xD3"  # Set Scan resume ON
 
 
-class VFOOperation(Enum):
+class VFOOperation(bytes, Enum):
     """VFO operation commands"""
 
     SELECT_VFO_A = b"\x00"  # Select VFO A
@@ -72,7 +72,7 @@ class VFOOperation(Enum):
     EXCHANGE_VFO_A_B = b"\xB0"  # Exchange VFO A and VFO B
 
 
-class TuningStep(Enum):
+class TuningStep(bytes, Enum):
     OFF = b"\x00"  # default: 10 Hz
     ON = b"\x01"  # 100Hz
     TS_1KHz = b"\x02"
@@ -1,7 +1,7 @@
 """Custom exceptions for the CI-V communication module"""
 
 
-class CivCommandException(BaseException):
+class CivCommandException(Exception):
     """
     This exception is generated when the CI-V response is NG
     """
@@ -17,9 +17,17 @@ class CivCommandException(BaseException):
         return f"{self.message} (0x{int.from_bytes(self.error_code, 'big'):02X})"
 
 
-class CivTimeoutException(BaseException):
+class CivTimeoutException(Exception):
     """
     This exception is generated when the CI-V read gets over the timeout
     """
 
     pass
+
+
+class CivProtocolException(Exception):
+    """
+    This exception is generated when the CI-V response is malformed or unexpected
+    """
+
+    pass
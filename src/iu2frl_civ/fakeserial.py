@@ -7,6 +7,8 @@ class FakeSerial:
     name: str = "FakeSerial"
     baudrate: int = 19200
     port: str = "/dev/ttyUSB0"
+    timeout: float = 1
+    in_waiting: int = 0
 
     def __init__(self, transceiver_address, controller_address, baudrate, port, *args, **kwargs):
         self.transceiver_address = transceiver_address
@@ -23,6 +25,14 @@ class FakeSerial:
         return_list = [0xFE, 0xFE, int.from_bytes(self.controller_address, 'big'), int.from_bytes(self.transceiver_address, 'big'), 0x00, 0x00, 0x00, 0x00, 0xFB, 0xFD]
         return bytes(return_list)
 
+    def read(self, *args, **kwargs):
+        """Fake readings of serial port data, always returning a whole reply"""
+        return self.read_until()
+
+    def reset_input_buffer(self):
+        """Fake clearing of the input buffer"""
+        pass
+
     def close(self):
         """Fake closing of the serial port"""
         pass
\ No newline at end of file
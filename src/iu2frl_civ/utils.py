@@ -1,4 +1,11 @@
+import asyncio
+import bisect
 import logging
+import functools
+import struct
+import threading
+import time
+from typing import Callable
 from serial import Serial
 
 from .exceptions import CivCommandException, CivTimeoutException
@@ -6,30 +13,120 @@ from .exceptions import CivCommandException, CivTimeoutException
 
 logger = logging.getLogger("iu2frl-civ")
 
+MAX_FRAME_SIZE = 1024  # Upper bound of a single reply, scope waveform data being the largest
+FRAME_CACHE_SIZE = 128  # How many assembled frames are kept by each Utils instance
+CACHED_DATA_SIZE = 2  # Frames with up to this many data bytes (on/off flags, levels) are cached
+REPLY_NG = 0xFA  # Status code of a failed command, OK is 0xFB
+
+
+# Packed BCD lookup tables: value (0-99) to byte and byte to value
+_BCD_ENCODE = bytes(((i // 10) << 4) | (i % 10) for i in range(100))
+_BCD_DECODE = tuple((byte >> 4) * 10 + (byte & 0x0F) for byte in range(256))
+
+_PACK_U16_LE = struct.Struct("<H").pack
+
+
+def _check_command(command):
+    """Raise a ValueError if the command cannot be sent"""
+    if not isinstance(command, bytes):
+        raise ValueError("Command must be a non-empty byte string")
+    if not 1 <= len(command) <= 4:
+        raise ValueError("Command must be 1-4 bytes long (command with an optional subcommand up to 3 bytes)")
+
+
+def _parse_hex_address(address: str, role: str) -> bytes:
+    """Convert a CI-V address in hexadecimal format (like 0x94) to bytes"""
+    if not (isinstance(address, str) and address.startswith("0x")):
+        raise ValueError(f"{role} address must be in hexadecimal format (0x00)")
+    return bytes.fromhex(address[2:])
+
+
+def _enc_bcd_le(frequency: int) -> bytes:
+    """Encode a frequency in Hz to 5 bytes of little endian BCD"""
+    return bytes(
+        (
+            _BCD_ENCODE[frequency % 100],
+            _BCD_ENCODE[(frequency // 100) % 100],
+            _BCD_ENCODE[(frequency // 10_000) % 100],
+            _BCD_ENCODE[(frequency // 1_000_000) % 100],
+            _BCD_ENCODE[(frequency // 100_000_000) % 100],
+        )
+    )
+
+
+def _dec_bcd_le(bcd_bytes, start: int = 0, length: int = 5) -> int:
+    """Decode `length` little endian BCD bytes found at `start` to a frequency in Hz"""
+    frequency = 0
+    for i in range(start + length - 1, start - 1, -1):
+        frequency = frequency * 100 + _BCD_DECODE[bcd_bytes[i]]
+    return frequency
+
+
+class RangeConverter:
+    """
+    Convert values from a fixed range to a new one, like Utils.convert_to_range
+
+    The ranges are reduced to a scale factor and an offset once, when the converter is created,
+    so each conversion of a polled value only takes a multiplication, a division and a sum.
+    """
+    __slots__ = ("_new_range", "_old_range", "_offset")
+
+    def __init__(self, old_min, old_max, new_min, new_max):
+        old_range = old_max - old_min
+        if old_range == 0:
+            # Every value is converted to new_min
+            self._new_range, self._old_range = 0, 1
+        else:
+            # Multiplication and division are kept separate (instead of a single slope) to return
+            # the very same values of convert_to_range: 100 * 255 / 100 is 255.0, 100 * 2.55 is 254.99...
+            self._new_range, self._old_range = new_max - new_min, old_range
+        self._offset = new_min - old_min * self._new_range / self._old_range
+
+    def __call__(self, input_value):
+        """Convert an input value to the new range"""
+        return input_value * self._new_range / self._old_range + self._offset
+
+
+class BaseUtils:
+    """
+    Frame building and parsing for the CI-V communication, shared by Utils and AsyncUtils
+
+    No data is sent or received here, each subclass adds the I/O over its own port.
+    """
+
+    __slots__ = ("transceiver_address", "controller_address", "_read_attempts", "debug", "_frame_prefix", "_reply_header", "_cached_frame")
 
-class Utils:
-    """List of utilities for the CI-V communication"""
-    _ser: Serial # Serial port object
     transceiver_address: bytes # Transceiver address
     controller_address: bytes # Controller address
     _read_attempts: int # Number of read attempts
-    fake: bool = False # Fake mode
-    debug: bool = False # Debug mode
-    
-    def __init__(self, serial: Serial, transceiver_address, controller_address, read_attempts, debug=False, fake=False):
-        self._ser = serial
+    debug: bool # Debug mode
+    _frame_prefix: bytes # Preamble and addresses of each frame
+    _reply_header: bytes # Preamble and addresses expected at the start of the replies
+    _cached_frame: Callable[..., bytes] # build_frame with the per-instance frame cache
+
+    def __init__(self, transceiver_address, controller_address, read_attempts, debug=False):
         self.transceiver_address = transceiver_address
         self.controller_address = controller_address
         self._read_attempts = read_attempts
-        self.fake = fake
+        self.debug = debug
+        # The frame header never changes, so it is written only once
+        self._frame_prefix = b"\xfe\xfe" + transceiver_address + controller_address
+        self._reply_header = b"\xfe\xfe" + controller_address + transceiver_address
+        # Frames are cached per instance, as they depend on the addresses
+        self._cached_frame = functools.lru_cache(maxsize=FRAME_CACHE_SIZE)(self.build_frame)
         if debug:
             logger.setLevel(logging.DEBUG)
 
     def encode_2_bytes_value(self, value: int) -> bytes:
         """
         Encodes a integer value into two bytes (little endian)
+
+        Raises:
+            ValueError: if the value does not fit in two bytes (0 to 65535)
         """
-        return value.to_bytes(2, byteorder="little")
+        if not 0 <= value <= 0xFFFF:
+            raise ValueError("Value must be between 0 and 65535")
+        return _PACK_U16_LE(value)
 
     def encode_int_to_icom_bytes(self, value: int) -> bytes:
         """
@@ -47,102 +144,140 @@ class Utils:
         """
         if value < 0:
             raise ValueError("Negative values are not supported")
-        encoded = []
-        while value > 0:
-            low = value % 10
-            high = (value // 10) % 10
-            encoded.append((high << 4) | low)  # Store as two-digit decimal BCD
-            value //= 100  # Move to the next two-digit pair
-        # Ensure at least two bytes (for numbers < 100)
-        while len(encoded) < 2:
-            encoded.append(0x00)
+        # Two decimal digits per byte, starting from the least significant pair
+        encoded = bytearray()
+        while value > 0 or len(encoded) < 2:  # At least two bytes (for numbers < 100)
+            value, pair = divmod(value, 100)
+            encoded.append(_BCD_ENCODE[pair])
         encoded.reverse()
         return bytes(encoded)
 
-    def send_command(self, command: bytes, data=b"", preamble=b"") -> bytes:
+    def build_frame(self, command: bytes, data: bytes = b"") -> bytes:
         """
-        Send a command to the radio transceiver
+        Build the frame to be sent to the transceiver
 
-        Returns: the response from the transceiver
+        Returns: the frame composed of preamble, addresses, command, data and terminator
         """
-        if command is None or not isinstance(command, bytes):
-            raise ValueError("Command must be a non-empty byte string")
-        if len(command) not in [1, 2, 3, 4]:
-            raise ValueError("Command must be 1-4 bytes long (command with an optional subcommand up to 3 bytes)")
-        # The command is composed of:
-        # - 0xFE 0xFE is the preamble
-        # - the transceiver address
-        # - the controller address
-        # - 0xFD is the terminator
-        command_string = preamble + b"\xfe\xfe" + self.transceiver_address + self.controller_address + command + data + b"\xfd"
-        logger.debug("Sending command: %s (length: %i)", self.bytes_to_string(command_string), len(command_string))
-        # Send the command to the COM port
-        self._ser.write(command_string)
-        # Read the response from the transceiver
-        reply = ""
-        valid_reply = False
-        for i in range(self._read_attempts):
-            # Read data from the serial port until the terminator byte
-            reply = self._ser.read_until(expected=b"\xfd")
+        return self._frame_prefix + command + data + b"\xfd"
+
+    def _get_frame(self, command: bytes, data=b"") -> bytes:
+        """
+        Build the frame of a command, taking it from the cache when the data is short (readings, flags and levels)
+
+        Frames with longer data (frequencies, text) are seldom repeated and are always built on the fly.
+        """
+        data = bytes(data)
+        if len(data) <= CACHED_DATA_SIZE:
+            return self._cached_frame(command, data)
+        return self.build_frame(command, data)
+
+    def _get_frames(self, commands: list) -> list:
+        """Validate multiple commands, given as tuples (command, data), and build their frames"""
+        frames = []
+        for command, data in commands:
+            _check_command(command)
+            frames.append(self._get_frame(command, data))
+        return frames
+
+    def _collect_reply(self, reply: bytes, frames: list, replies: list) -> bool:
+        """
+        Handle a frame received after sending multiple commands at once, appending it to `replies` if it is a valid reply
+
+        Returns: False if the read failed (timeout, truncated frame or frame for another device), True otherwise
+
+        Raises:
+            CivCommandException: if the transceiver replied NG (0xFA) to one of the commands
+        """
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Received message: %s (length: %i)", self.bytes_to_string(reply), len(reply))
-            # Check if we received an echo message
-            if reply == command_string:
-                i -= 1  # Decrement cycles as it is just the echo back
-                logger.debug("Ignoring echo message")
-            # Check the response
-            elif len(reply) > 2:
-                target_controller: bytes = reply[2].to_bytes(1, "big")  # Target address of the reply from the transceiver
-                source_transceiver: bytes = reply[3].to_bytes(1, "big")  # Source address of the reply from the transceiver
-                reply_code: bytes = reply[len(reply) - 2].to_bytes(1, "big")  # Command reply status code
-                # Check if the response is for us
-                if target_controller != self.controller_address or source_transceiver != self.transceiver_address:
-                    logger.debug(
-                        "Ignoring message which is not for us " + f"(received: {self.bytes_to_string(source_transceiver)} -> {self.bytes_to_string(target_controller)} " + f"but we are using: {self.bytes_to_string(self.transceiver_address)} -> {self.bytes_to_string(self.controller_address)})"
-                    )
-                    i -= 1  # Decrement cycles to ignore messages not for us
-                # Check the return code (0xFA is only returned in case of error)
-                elif reply_code == bytes.fromhex("FA"):  # 0xFA (not good)
-                    logger.debug("Reply status: NG (%s)", self.bytes_to_string(reply_code))
-                    raise CivCommandException("Reply status: NG", reply_code)
-                else:
-                    logger.debug("Reply status: OK (0xFB)")
-                    valid_reply = True
-                    break
-            # Check if the respose was empty (timeout)
-            else:
-                logger.debug("Serial communication timeout (%i/%i)", i + 1, self._read_attempts)
-        # Return the result to the user
-        if not valid_reply:
-            raise CivTimeoutException(f"Communication timeout occurred after {i+1} attempts")
-        else:
-            return reply
+        # Check if we received an echo message
+        if reply in frames:
+            logger.debug("Ignoring echo message")
+            return True
+        # Check the response
+        try:
+            valid_reply = self.parse_reply(reply)
+        except CivCommandException as e:
+            raise CivCommandException(f"{e.message} (command {len(replies) + 1} of {len(frames)})", e.error_code) from None
+        if valid_reply:
+            replies.append(reply)
+        return valid_reply
+
+    def _check_failed_reads(self, failed_reads: int, frames: list, replies: list):
+        """Give up reading the replies to multiple commands once all the read attempts failed"""
+        if failed_reads >= self._read_attempts:
+            raise CivTimeoutException(f"Communication timeout occurred after {failed_reads} attempts ({len(replies)} of {len(frames)} replies received)")
 
-    def decode_frequency(self, bcd_bytes) -> int:
-        """Decode BCD-encoded frequency bytes to a frequency in Hz"""
-        # Reverse the bytes for little-endian interpretation
-        reversed_bcd = bcd_bytes[::-1]
-        # Convert each byte to its two-digit BCD representation
-        frequency_bcd = "".join(f"{byte:02X}" for byte in reversed_bcd)
-        return int(frequency_bcd)  # Convert to integer (frequency in Hz)
+    def is_complete_frame(self, reply: bytes) -> bool:
+        """Check if the reply starts with the preamble and ends with the terminator"""
+        return len(reply) >= 6 and reply[0] == 0xFE and reply[1] == 0xFE and reply[-1] == 0xFD
+
+    def parse_reply(self, reply: bytes) -> bool:
+        """
+        Validate a frame received from the transceiver (the echo of the command must be filtered out before)
+
+        Returns: True if the frame is a positive reply for us, False if it is truncated or addressed to another device
+
+        Raises:
+            CivCommandException: if the transceiver replied NG (0xFA)
+        """
+        # Complete frame for us: preamble, addresses and terminator checked at once
+        if len(reply) >= 6 and reply[-1] == 0xFD and reply.startswith(self._reply_header):
+            # Check the return code (0xFA is only returned in case of error)
+            if reply[-2] == REPLY_NG:
+                logger.debug("Reply status: NG (0xFA)")
+                raise CivCommandException("Reply status: NG", b"\xfa")
+            logger.debug("Reply status: OK")
+            return True
+        # Check if the respose was empty or truncated (timeout)
+        if not self.is_complete_frame(reply):
+            logger.debug("Serial communication timeout or incomplete frame")
+        # Otherwise the response is not for us
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Ignoring message which is not for us (received: %s -> %s but we are using: %s -> %s)",
+                self.bytes_to_string(reply[3:4]), self.bytes_to_string(reply[2:3]), self.bytes_to_string(self.transceiver_address), self.bytes_to_string(self.controller_address),
+            )
+        return False
+
+    def decode_frequency(self, bcd_bytes, start: int = 0, length: int = 5) -> int:
+        """
+        Decode BCD-encoded frequency bytes to a frequency in Hz
+
+        The bytes are read in place starting from `start`, so a whole reply can be passed without slicing it
+        """
+        return _dec_bcd_le(bcd_bytes, start, length)
+
+    def decode_frequencies(self, bcd_bytes, length: int = 5) -> list:
+        """
+        Decode consecutive BCD-encoded frequencies (like recorded samples) to a list of frequencies in Hz
+
+        The hex representation of BCD bytes already is the decimal number, so the whole buffer
+        is reversed and converted at once instead of decoding each sample byte by byte.
+
+        Raises:
+            ValueError: if the data is not made of `length` bytes frequencies or contains invalid BCD digits
+        """
+        if len(bcd_bytes) % length:
+            raise ValueError(f"Data length must be a multiple of {length} bytes")
+        digits = bytes(bcd_bytes[::-1]).hex()
+        step = length * 2
+        return [int(digits[i : i + step]) for i in range(len(digits) - step, -1, -step)]
 
     def encode_frequency(self, frequency) -> bytes:
         """Convert the frequency to the CI-V representation"""
-        frequency_str = str(frequency).rjust(10, "0")
-        inverted_freq = frequency_str[::-1]
-        hex_list = [f"0x{inverted_freq[1]}{inverted_freq[0]}"]
-        hex_list.append(f"0x{inverted_freq[3]}{inverted_freq[2]}")
-        hex_list.append(f"0x{inverted_freq[5]}{inverted_freq[4]}")
-        hex_list.append(f"0x{inverted_freq[7]}{inverted_freq[6]}")
-        hex_list.append(f"0x{inverted_freq[9]}{inverted_freq[8]}")
-        return bytes([int(hx, 16) for hx in hex_list])
+        return _enc_bcd_le(frequency)
 
     def bytes_to_string(self, bytes_array: bytearray) -> str:
         """Convert a byte array to a string"""
-        return "0x" + " 0x".join(f"{byte:02X}" for byte in bytes_array)
+        if not bytes_array:
+            return "0x"
+        # Let hex() format all the bytes in C, then add the 0x prefixes with a single replace
+        return "0x" + bytes(bytes_array).hex(" ").upper().replace(" ", " 0x")
 
-    def bytes_to_int(self, first_byte: bytes, second_byte: bytes) -> int:
-        """Convert a byte array to an integer"""
-        return (int(first_byte) * 100) + int(f"{second_byte:02X}")
+    def bytes_to_int(self, first_byte: int, second_byte: int) -> int:
+        """Convert two BCD bytes (like 0x02 0x55) to an integer (255)"""
+        return _BCD_DECODE[first_byte] * 100 + _BCD_DECODE[second_byte]
 
     def linear_interpolate(self, raw_value: int, points: list) -> float:
         """
@@ -150,30 +285,23 @@ class Utils:
 
         Args:
             raw_value (int): The raw input value to interpolate.
-            points (list): A list of tuples (raw, value) representing the known points.
+            points (list): A sequence of tuples (raw, value) representing the known points, sorted by raw value.
 
         Returns:
             float: The interpolated or exact value.
         """
-        # Check if raw_value matches any known point
-        for point in points:
-            if raw_value == point[0]:
-                return float(point[1])
-
-        # Perform linear interpolation between points
-        for i in range(len(points) - 1):
-            x0, y0 = points[i]
-            x1, y1 = points[i + 1]
-            if x0 < raw_value < x1:
-                return y0 + (y1 - y0) * (raw_value - x0) / (x1 - x0)
-
+        # Index of the first point with raw >= raw_value, as (raw_value,) sorts before (raw_value, value)
+        i = bisect.bisect_left(points, (raw_value,))
         # Handle out-of-range values
-        if raw_value < points[0][0]:
-            return float(points[0][1])
-        if raw_value > points[-1][0]:
+        if i == len(points):
             return float(points[-1][1])
-
-        return -1.0  # Return -1 if interpolation is not possible
+        x1, y1 = points[i]
+        # Exact match, or below the first point
+        if x1 == raw_value or i == 0:
+            return float(y1)
+        # Perform linear interpolation between points
+        x0, y0 = points[i - 1]
+        return y0 + (y1 - y0) * (raw_value - x0) / (x1 - x0)
 
     def convert_to_range(self, input_value, old_min, old_max, new_min, new_max):
         """Convert an input value from a range to a new one"""
@@ -184,3 +312,270 @@ class Utils:
             new_range = new_max - new_min
             new_value = (((input_value - old_min) * new_range) / old_range) + new_min
         return new_value
+
+
+class Utils(BaseUtils):
+    """List of utilities for the CI-V communication"""
+
+    __slots__ = ("_ser", "fake", "_lock", "_rx_buffer")
+
+    _ser: Serial # Serial port object
+    fake: bool # Fake mode
+    _lock: threading.RLock # Serializes the access to the serial port
+    _rx_buffer: bytearray # Bytes received but not yet returned as a frame
+
+    def __init__(self, serial: Serial, transceiver_address, controller_address, read_attempts, debug=False, fake=False):
+        super().__init__(transceiver_address, controller_address, read_attempts, debug=debug)
+        self._ser = serial
+        self.fake = fake
+        self._rx_buffer = bytearray()
+        self._lock = threading.RLock()
+
+    def read_frame(self) -> bytes:
+        """
+        Read a single frame from the serial port, up to the 0xFD terminator
+
+        All the bytes waiting in the port are read at once, instead of one by one,
+        and the ones following the terminator are kept for the next frame.
+        The port timeout is honored for the whole frame, not for each byte: no read is started once
+        it expired (no timeout blocks until the terminator is received, like `read_until`).
+
+        Returns: the frame, or the partial data received before the timeout (empty if nothing was received)
+        """
+        buffer = self._rx_buffer
+        ser = self._ser
+        # The port timeout is never changed here, as pyserial reconfigures the port each time it is set
+        deadline = None if ser.timeout is None else time.monotonic() + ser.timeout
+        while True:
+            end = buffer.find(b"\xfd")
+            if end >= 0:
+                frame = bytes(buffer[: end + 1])
+                del buffer[: end + 1]
+                return frame
+            if len(buffer) > MAX_FRAME_SIZE or (deadline is not None and time.monotonic() >= deadline):
+                break
+            chunk = ser.read(ser.in_waiting or 1)
+            if not chunk:
+                break
+            buffer += chunk
+        frame = bytes(buffer)
+        buffer.clear()
+        return frame
+
+    def reset_input_buffer(self):
+        """Discard any data received and not yet read"""
+        with self._lock:
+            self._rx_buffer.clear()
+            self._ser.reset_input_buffer()
+
+    def send_command(self, command: bytes, data=b"", preamble=b"") -> bytes:
+        """
+        Send a command to the radio transceiver
+
+        Returns: the response from the transceiver
+        """
+        _check_command(command)
+        # The command is composed of:
+        # - 0xFE 0xFE is the preamble
+        # - the transceiver address
+        # - the controller address
+        # - 0xFD is the terminator
+        with self._lock:
+            if preamble:
+                # The wake-up preamble is only sent once, no need to cache it
+                command_string = preamble + self.build_frame(command, bytes(data))
+            else:
+                command_string = self._get_frame(command, data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending command: %s (length: %i)", self.bytes_to_string(command_string), len(command_string))
+            # Send the command to the COM port
+            self._ser.write(command_string)
+            # Read the response from the transceiver, the echo of the command is not a failed read
+            failed_reads = 0
+            while failed_reads < self._read_attempts:
+                # Read data from the serial port until the terminator byte
+                reply = self.read_frame()
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Received message: %s (length: %i)", self.bytes_to_string(reply), len(reply))
+                # Check if we received an echo message
+                if reply == command_string:
+                    logger.debug("Ignoring echo message")
+                elif self.parse_reply(reply):
+                    return reply
+                else:
+                    failed_reads += 1
+            raise CivTimeoutException(f"Communication timeout occurred after {failed_reads} attempts")
+
+    def send_commands(self, commands: list) -> list:
+        """
+        Send multiple commands to the radio transceiver using a single write
+
+        Only commands which do not depend on the reply of the previous ones
+        should be sent this way, as all the frames are transmitted at once.
+
+        Args:
+            commands (list): A list of tuples (command, data) to be sent.
+
+        Returns: the list of responses from the transceiver, in the same order of the commands
+        """
+        frames = self._get_frames(commands)
+        command_string = b"".join(frames)
+        with self._lock:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending %i commands: %s (length: %i)", len(frames), self.bytes_to_string(command_string), len(command_string))
+            # Send all the commands to the COM port at once
+            self._ser.write(command_string)
+            # Read the responses from the transceiver
+            replies = []
+            failed_reads = 0
+            try:
+                while len(replies) < len(frames):
+                    if not self._collect_reply(self.read_frame(), frames, replies):
+                        failed_reads += 1
+                        self._check_failed_reads(failed_reads, frames, replies)
+            except CivCommandException:
+                # The replies to the following commands are still on their way
+                self._discard_replies(frames, len(frames) - len(replies) - 1)
+                raise
+            except CivTimeoutException:
+                self.reset_input_buffer()
+                raise
+            return replies
+
+    def _discard_replies(self, frames: list, pending: int):
+        """
+        Drop the replies still expected after multiple commands failed, so they are not taken as the reply to the next command
+        """
+        while pending > 0:
+            reply = self.read_frame()
+            if not reply:
+                break
+            if reply not in frames and reply.startswith(self._reply_header):
+                pending -= 1
+        self.reset_input_buffer()
+
+
+class AsyncUtils(BaseUtils):
+    """List of utilities for the CI-V communication using asyncio streams"""
+
+    __slots__ = ("_reader", "_writer", "_timeout", "_async_lock")
+
+    _reader: asyncio.StreamReader # Stream used to receive data from the transceiver
+    _writer: asyncio.StreamWriter # Stream used to send data to the transceiver
+    _timeout: float # Timeout of each read attempt in seconds
+    _async_lock: asyncio.Lock # Serializes the access to the streams
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, transceiver_address, controller_address, read_attempts, timeout=1, debug=False):
+        super().__init__(transceiver_address, controller_address, read_attempts, debug=debug)
+        self._reader = reader
+        self._writer = writer
+        self._timeout = timeout
+        self._async_lock = asyncio.Lock()
+
+    @classmethod
+    async def open(cls, radio_address: str, port: str, baudrate: int, controller_address: str, read_attempts, timeout=1, debug=False, rts=None, dtr=None) -> "AsyncUtils":
+        """
+        Validate the addresses, open the serial port and return the utilities using it
+
+        Requires the `pyserial-asyncio` package.
+        The RTS and DTR lines are only changed if a value is specified.
+        """
+        try:
+            import serial_asyncio
+        except ImportError as e:
+            raise ImportError("The asyncio interface requires the pyserial-asyncio package") from e
+        transceiver_address = _parse_hex_address(radio_address, "Transceiver")
+        controller_address = _parse_hex_address(controller_address, "Controller")
+        reader, writer = await serial_asyncio.open_serial_connection(url=port, baudrate=baudrate, dsrdtr=False)
+        if rts is not None:
+            writer.transport.serial.rts = rts
+        if dtr is not None:
+            writer.transport.serial.dtr = dtr
+        logger.debug("Opened port: %s", port)
+        return cls(reader, writer, transceiver_address, controller_address, read_attempts, timeout=timeout, debug=debug)
+
+    def close(self):
+        """Close the serial port"""
+        self._writer.close()
+
+    async def _read_frame_async(self) -> bytes:
+        """
+        Read a single frame from the stream, up to the 0xFD terminator
+
+        Returns: the frame, or an empty frame if it was not received within the timeout
+        """
+        try:
+            return await asyncio.wait_for(self._reader.readuntil(b"\xfd"), self._timeout)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+            return b""
+
+    async def send_command_async(self, command: bytes, data=b"") -> bytes:
+        """
+        Send a command to the radio transceiver without blocking the event loop
+
+        Returns: the response from the transceiver
+        """
+        _check_command(command)
+        command_string = self._get_frame(command, data)
+        async with self._async_lock:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending command: %s (length: %i)", self.bytes_to_string(command_string), len(command_string))
+            self._writer.write(command_string)
+            await self._writer.drain()
+            failed_reads = 0
+            while failed_reads < self._read_attempts:
+                reply = await self._read_frame_async()
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Received message: %s (length: %i)", self.bytes_to_string(reply), len(reply))
+                # Check if we received an echo message
+                if reply == command_string:
+                    logger.debug("Ignoring echo message")
+                elif self.parse_reply(reply):
+                    return reply
+                else:
+                    failed_reads += 1
+        raise CivTimeoutException(f"Communication timeout occurred after {failed_reads} attempts")
+
+    async def send_commands_async(self, commands: list) -> list:
+        """
+        Send multiple commands to the radio transceiver using a single write without blocking the event loop
+
+        Only commands which do not depend on the reply of the previous ones
+        should be sent this way, as all the frames are transmitted at once.
+
+        Args:
+            commands (list): A list of tuples (command, data) to be sent.
+
+        Returns: the list of responses from the transceiver, in the same order of the commands
+        """
+        frames = self._get_frames(commands)
+        command_string = b"".join(frames)
+        async with self._async_lock:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending %i commands: %s (length: %i)", len(frames), self.bytes_to_string(command_string), len(command_string))
+            # Send all the commands at once, the replies are parsed while the next ones are still in flight
+            self._writer.write(command_string)
+            await self._writer.drain()
+            replies = []
+            failed_reads = 0
+            try:
+                while len(replies) < len(frames):
+                    if not self._collect_reply(await self._read_frame_async(), frames, replies):
+                        failed_reads += 1
+                        self._check_failed_reads(failed_reads, frames, replies)
+            except CivCommandException:
+                # The replies to the following commands are still on their way
+                await self._discard_replies_async(frames, len(frames) - len(replies) - 1)
+                raise
+            return replies
+
+    async def _discard_replies_async(self, frames: list, pending: int):
+        """
+        Drop the replies still expected after multiple commands failed, so they are not taken as the reply to the next command
+        """
+        while pending > 0:
+            reply = await self._read_frame_async()
+            if not reply:
+                break
+            if reply not in frames and reply.startswith(self._reply_header):
+                pending -= 1
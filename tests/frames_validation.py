@@ -0,0 +1,259 @@
+"""
+This code is an automated testing mechanism to validate the exact frames sent
+for the settings encoded in BCD, and how the replies are read back.
+It is not meant to be used as an example of the library.
+"""
+
+import sys
+import time
+import logging
+
+logging.basicConfig()
+logging.getLogger().setLevel(logging.WARNING)
+
+try:
+    # Import the library installed using pip
+    from iu2frl_civ.device_factory import DeviceFactory
+    from iu2frl_civ.enums import DeviceType, OperatingMode, VFOOperation
+    from iu2frl_civ.exceptions import CivCommandException
+
+    print("Calling test using installed library")
+except ImportError:
+    # Use this block if working with source code
+    from pathlib import Path
+
+    sys.path.append(str(Path(__file__).parent.parent))
+    from src.iu2frl_civ.device_factory import DeviceFactory
+    from src.iu2frl_civ.enums import DeviceType, OperatingMode, VFOOperation
+    from src.iu2frl_civ.exceptions import CivCommandException
+
+    print("Calling test using local library files")
+
+
+# Frames expected for each call: (device type, method name, arguments, frame)
+EXPECTED_FRAMES = [
+    # Single BCD byte settings of 10 and above (0x15 for 15, not 0x0F)
+    (DeviceType.Generic, "set_vox_delay", (15,), "FEFE94E01A05019115FD"),
+    (DeviceType.Generic, "set_vox_voice_delay", (2,), "FEFE94E01A05019202FD"),
+    (DeviceType.IC_7300, "set_vox_delay", (20,), "FEFE94E01A05019120FD"),
+    (DeviceType.IC_7300, "set_repeat_interval_voice_memory", (12,), "FEFE94E01A05018112FD"),
+    # Memory channels in BCD (0x00 0x12 for channel 12, not 0x00 0x0C)
+    (DeviceType.IC_7300, "set_memory_name", (12, "TEST"), "FEFE94E01A000012000000000000000000000054455354202020202020FD"),
+    (DeviceType.IC_7300, "set_memory_name", (99, "A"), "FEFE94E01A000099000000000000000000000041202020202020202020FD"),
+    (DeviceType.Generic, "set_memory_mode", (12,), "FEFE94E0080012FD"),
+    (DeviceType.IC_7300, "set_memory_mode", (99,), "FEFE94E0080099FD"),
+    (DeviceType.IC_7300, "set_memory_mode", (100,), "FEFE94E0080100FD"),
+    (DeviceType.IC_706_MK2, "set_memory_mode", (12,), "FEFE94E0080012FD"),
+    (DeviceType.IC_706_MK2, "set_memory_mode", (101,), "FEFE94E0080101FD"),
+    # Scope reference level: 0x00 (main scope), level in 0.01 dB (BCD), sign (0x01 for negative)
+    (DeviceType.IC_7300, "set_scope_reference_level", (-10.5,), "FEFE94E0271900105001FD"),
+    (DeviceType.IC_7300, "set_scope_reference_level", (0.5,), "FEFE94E0271900005000FD"),
+    (DeviceType.IC_7300, "set_scope_reference_level", (20.0,), "FEFE94E0271900200000FD"),
+    (DeviceType.IC_7300, "set_scope_reference_level", (0,), "FEFE94E0271900000000FD"),
+]
+
+
+class ScriptedSerial:
+    """Serial port echoing each frame written, like the CI-V bus, followed by the next scripted reply"""
+
+    timeout = 0.05
+    in_waiting = property(lambda self: len(self._input))
+
+    def __init__(self, replies, chunk_size=None):
+        # Content of each reply (status code or command and data), from the first frame written on
+        self._replies = list(replies)
+        self._input = bytearray()
+        # Largest number of bytes returned by each read, to split the frames
+        self._chunk_size = chunk_size
+        self.written = []
+
+    def feed(self, data):
+        """Receive data which is not a reply to the frames written"""
+        self._input += data
+
+    def write(self, data):
+        self.written.append(bytes(data))
+        self._input += data
+        for frame in bytes(data).split(b"\xfd")[:-1]:
+            if self._replies:
+                # Swap the addresses of the frame received
+                self._input += b"\xfe\xfe" + frame[3:4] + frame[2:3] + self._replies.pop(0) + b"\xfd"
+
+    def read(self, size=1):
+        if self._chunk_size is not None:
+            size = min(size, self._chunk_size)
+        data = bytes(self._input[:size])
+        del self._input[:size]
+        return data
+
+    def reset_input_buffer(self):
+        self._input.clear()
+
+
+def check_failed_batch() -> int:
+    """
+    Check that the replies still pending after a command of a batch failed are not taken as replies to the next command
+    """
+    radio = DeviceFactory.get_repository(radio_address="0x94", device_type=DeviceType.IC_706_MK2, port="COM10", debug=False, fake=True)
+    # NG to the mode, then the reply to the frequency read afterwards
+    radio.utils._ser = ScriptedSerial([b"\xfb", b"\xfa", b"\xfb", b"\x03\x00\x40\x07\x14\x00"])
+    try:
+        radio.configure(vfo_mode=VFOOperation.SELECT_VFO_A, mode=OperatingMode.USB, frequency_hz=14_074_000)
+        logging.error("configure did not raise on NG")
+        return 1
+    except CivCommandException:
+        pass
+    frequency = radio.read_operating_frequency()
+    if frequency != 14_074_000:
+        logging.error("Frequency read after a failed batch is %s, expected 14074000", frequency)
+        return 1
+    return 0
+
+
+def check_queue_flush() -> int:
+    """
+    Check that the commands queued together are sent with a single write by the flusher thread
+    """
+    radio = DeviceFactory.get_repository(radio_address="0x94", device_type=DeviceType.IC_706_MK2, port="COM10", debug=False, fake=True)
+    radio.utils._ser = ScriptedSerial([b"\xfb", b"\xfb"])
+    radio.queue_command(b"\x07", b"\x00")
+    radio.queue_command(b"\x06", b"\x01")
+    time.sleep(0.2)
+    sent = " ".join(frame.hex().upper() for frame in radio.utils._ser.written)
+    if sent != "FEFE94E00700FDFEFE94E00601FD":
+        logging.error("Queued commands sent as %s, expected a single write", sent)
+        return 1
+    return 0
+
+
+def check_batch_order() -> int:
+    """
+    Check that the replies to multiple commands sent at once are returned in the order of the commands
+    """
+    radio = DeviceFactory.get_repository(radio_address="0x94", device_type=DeviceType.IC_7300, port="COM10", debug=False, fake=True)
+    radio.utils._ser = ScriptedSerial(
+        [b"\x15\x02\x01\x20", b"\x15\x11\x01\x43", b"\x15\x12\x01\x20", b"\x15\x13\x01\x20", b"\x15\x14\x01\x30", b"\x15\x15\x00\x13", b"\x15\x16\x00\x97"]
+    )
+    meters = radio.read_meters()
+    expected = {"smeter": 120, "po": 50.0, "swr": 3.0, "alc": 100.0, "comp": 15.0, "vd": 10.0, "id": 10.0}
+    if meters != expected or len(radio.utils._ser.written) != 1:
+        logging.error("Meters read as %s with %i writes, expected %s with a single write", meters, len(radio.utils._ser.written), expected)
+        return 1
+    return 0
+
+
+def check_skip_redundant_writes() -> int:
+    """
+    Check that the frequency and mode already set are not sent again, only if enabled
+    """
+    failed_tests = 0
+    radio = DeviceFactory.get_repository(radio_address="0x94", device_type=DeviceType.IC_706_MK2, port="COM10", debug=False, fake=True)
+    for skip, expected_writes in ((True, 2), (False, 4)):
+        radio.skip_redundant_writes = skip
+        radio._invalidate_cache()
+        radio.utils._ser = ScriptedSerial([b"\xfb"] * 4)
+        for _ in range(2):
+            radio.send_operating_frequency(14_074_000)
+            radio.set_operating_mode(OperatingMode.USB)
+        if len(radio.utils._ser.written) != expected_writes:
+            logging.error("%i frames written with skip_redundant_writes=%s, expected %i", len(radio.utils._ser.written), skip, expected_writes)
+            failed_tests += 1
+    return failed_tests
+
+
+def check_read_frame() -> int:
+    """
+    Check that frames split across reads, received together or addressed to another device are handled
+    """
+    failed_tests = 0
+    reply = bytes.fromhex("FEFEE094030040071400FD")
+    radio = DeviceFactory.get_repository(radio_address="0x94", device_type=DeviceType.IC_7300, port="COM10", debug=False, fake=True)
+    # Frame received three bytes at a time
+    radio.utils._ser = ScriptedSerial([], chunk_size=3)
+    radio.utils._ser.feed(reply)
+    frame = radio.utils.read_frame()
+    if frame != reply:
+        logging.error("Split frame read as %s", frame.hex().upper())
+        failed_tests += 1
+    # Two frames received by a single read
+    radio.utils._ser = ScriptedSerial([])
+    radio.utils._ser.feed(b"\xfe\xfe\xe0\x94\xfb\xfd" + reply)
+    frames = [radio.utils.read_frame(), radio.utils.read_frame()]
+    if frames != [b"\xfe\xfe\xe0\x94\xfb\xfd", reply]:
+        logging.error("Concatenated frames read as %s", " ".join(frame.hex().upper() for frame in frames))
+        failed_tests += 1
+    # Frame of another transceiver received before the reply
+    radio.utils._ser = ScriptedSerial([b"\x03\x00\x40\x07\x14\x00"])
+    radio.utils._ser.feed(b"\xfe\xfe\xe0\x98\x03\x00\x00\x10\x07\x00\xfd")
+    frequency = radio.read_operating_frequency()
+    if frequency != 14_074_000:
+        logging.error("Frequency read after a frame of another transceiver is %s, expected 14074000", frequency)
+        failed_tests += 1
+    return failed_tests
+
+
+def check_decode_frequencies() -> int:
+    """
+    Check the decoding of consecutive BCD frequencies
+    """
+    radio = DeviceFactory.get_repository(radio_address="0x94", device_type=DeviceType.IC_7300, port="COM10", debug=False, fake=True)
+    frequencies = radio.utils.decode_frequencies(bytes.fromhex("0040071400" "0000100700" "9999999999"))
+    if frequencies != [14_074_000, 7_100_000, 9_999_999_999]:
+        logging.error("Frequencies decoded as %s", frequencies)
+        return 1
+    try:
+        radio.utils.decode_frequencies(b"\x00\x40\x07")
+        logging.error("decode_frequencies accepted a partial frequency")
+        return 1
+    except ValueError:
+        return 0
+
+
+# Main program
+def main() -> int:
+    """
+    Check the frames written to the fake serial port against the expected ones
+    """
+
+    failed_tests = 0
+
+    for check in (check_failed_batch, check_queue_flush, check_batch_order, check_skip_redundant_writes, check_read_frame, check_decode_frequencies):
+        try:
+            failed_tests += check()
+        except Exception as e:
+            logging.error("Error executing %s: %s", check.__name__, e)
+            failed_tests += 1
+
+    for device_type, method_name, args, expected in EXPECTED_FRAMES:
+        radio = DeviceFactory.get_repository(radio_address="0x94", device_type=device_type, port="COM10", debug=False, fake=True)
+        # Record the frames instead of discarding them
+        sent_frames = []
+        radio.utils._ser.write = lambda data, frames=sent_frames: frames.append(bytes(data))
+        try:
+            getattr(radio, method_name)(*args)
+        except Exception as e:
+            logging.error("%s -> Error executing %s%s: %s", device_type.name, method_name, args, e)
+            failed_tests += 1
+            continue
+        sent = " ".join(frame.hex().upper() for frame in sent_frames)
+        if sent != expected:
+            logging.error("%s -> %s%s sent %s, expected %s", device_type.name, method_name, args, sent, expected)
+            failed_tests += 1
+        else:
+            logging.info("%s -> %s%s sent %s", device_type.name, method_name, args, sent)
+
+    logging.info("Frames testing complete")
+    return failed_tests
+
+
+if __name__ == "__main__":
+    print("Starting frames testing using fake mode\n\n")
+
+    failures = main()
+
+    if failures > 0:
+        print(f"\n\n{failures} tests were failed")
+        sys.exit(1)
+    else:
+        print("\n\nAll tests were passed")
+        sys.exit(0)